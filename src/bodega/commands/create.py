@@ -121,7 +121,7 @@ def create(
             raise SystemExit(1)
 
         # Validate dependencies exist
-        all_ids = storage.list_ids()
+        all_ids = set(storage.list_ids())
         for d in ticket.deps:
             if d not in all_ids:
                 click.echo(f"Warning: Dependency {d} does not exist", err=True)
@@ -106,8 +106,9 @@ def link(ctx: Context, id1: str, id2: str):
         if ticket1.id not in ticket2.links:
             ticket2.links.append(ticket1.id)
 
-        storage.save(ticket1)
-        storage.save(ticket2)
+        with storage.transaction(f"Link {ticket1.id} and {ticket2.id}"):
+            storage.save(ticket1)
+            storage.save(ticket2)
         click.echo(f"Linked {ticket1.id} ↔ {ticket2.id}")
 
     except TicketNotFoundError as e:
@@ -150,8 +151,9 @@ def unlink(ctx: Context, id1: str, id2: str):
             click.echo(f"{ticket1.id} and {ticket2.id} are not linked")
             return
 
-        storage.save(ticket1)
-        storage.save(ticket2)
+        with storage.transaction(f"Unlink {ticket1.id} and {ticket2.id}"):
+            storage.save(ticket1)
+            storage.save(ticket2)
         click.echo(f"Unlinked {ticket1.id} ↔ {ticket2.id}")
 
     except TicketNotFoundError as e:
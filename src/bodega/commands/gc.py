@@ -77,12 +77,15 @@ def gc(ctx: Context, age: str, dry_run: bool):
 
     # Delete tickets
     deleted_count = 0
-    for ticket in tickets_to_delete:
-        try:
-            storage.delete(ticket.id)
-            deleted_count += 1
-        except Exception as e:
-            click.echo(f"Warning: Failed to delete {ticket.id}: {e}", err=True)
+    with storage.transaction(
+        f"Garbage collect {len(tickets_to_delete)} closed ticket(s) older than {age}"
+    ):
+        for ticket in tickets_to_delete:
+            try:
+                storage.delete(ticket.id)
+                deleted_count += 1
+            except Exception as e:
+                click.echo(f"Warning: Failed to delete {ticket.id}: {e}", err=True)
 
     click.echo(f"Deleted {deleted_count} ticket(s)")
 
@@ -90,23 +90,24 @@ def import_tickets(
             new_id = generate_id(ctx.config.id_prefix)
         id_map[old_id] = new_id
 
-    # Convert and save tickets
+    # Convert and save tickets, committing the whole import at once
     migrated = 0
-    for issue in issues:
-        try:
-            ticket = convert_beads_issue(issue, id_map, preserve_ids, ctx.config.id_prefix)
+    with storage.transaction(f"Import {len(issues)} ticket(s) from beads"):
+        for issue in issues:
+            try:
+                ticket = convert_beads_issue(issue, id_map, preserve_ids, ctx.config.id_prefix)
 
-            if dry_run:
-                click.echo(f"  Would create: {ticket.id} - {ticket.title}")
-            else:
-                storage.create(ticket)
-                click.echo(f"  Created: {ticket.id} - {ticket.title}")
+                if dry_run:
+                    click.echo(f"  Would create: {ticket.id} - {ticket.title}")
+                else:
+                    storage.create(ticket)
+                    click.echo(f"  Created: {ticket.id} - {ticket.title}")
 
-            migrated += 1
+                migrated += 1
 
-        except Exception as e:
-            old_id = issue.get("id", "unknown")
-            click.echo(f"  Error importing {old_id}: {e}", err=True)
+            except Exception as e:
+                old_id = issue.get("id", "unknown")
+                click.echo(f"  Error importing {old_id}: {e}", err=True)
 
     if dry_run:
         click.echo(f"\nDry run complete. Would import {migrated} tickets.")
@@ -3,11 +3,12 @@
 import click
 import json
 import sys
+from operator import attrgetter
 
 from bodega.commands.utils import pass_context, Context, require_repo
 from bodega.models.ticket import TicketStatus
 from bodega.operations import get_ready_tickets, query_tickets
-from bodega.output import format_tickets, ticket_to_dict
+from bodega.output import write_tickets, ticket_to_dict
 from bodega.graph import DependencyGraph
 from bodega.errors import TicketNotFoundError, AmbiguousIDError
 
@@ -90,8 +91,7 @@ def list_tickets(
     tickets.sort(key=sort_key, reverse=reverse)
 
     # Format and output
-    output = format_tickets(tickets, ctx.config, fmt)
-    click.echo(output)
+    write_tickets(tickets, ctx.config, fmt)
 
 
 @click.command()
@@ -114,8 +114,7 @@ def ready(ctx: Context, tag: str | None = None):
     if tag:
         tickets = [t for t in tickets if tag in t.tags]
 
-    output = format_tickets(tickets, ctx.config)
-    click.echo(output)
+    write_tickets(tickets, ctx.config)
 
 
 @click.command()
@@ -135,7 +134,7 @@ def blocked(ctx: Context):
     graph = DependencyGraph(storage)
 
     tickets = graph.get_blocked_tickets()
-    tickets.sort(key=lambda t: (t.priority, t.created))
+    tickets.sort(key=attrgetter("priority", "created"))
 
     if not tickets:
         click.echo("No blocked tickets.")
@@ -171,11 +170,10 @@ def closed(ctx: Context, count: int):
     ))
 
     # Sort by updated (most recently closed first)
-    tickets.sort(key=lambda t: t.updated, reverse=True)
+    tickets.sort(key=attrgetter("updated"), reverse=True)
     tickets = tickets[:count]
 
-    output = format_tickets(tickets, ctx.config)
-    click.echo(output)
+    write_tickets(tickets, ctx.config)
 
 
 @click.command()
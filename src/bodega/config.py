@@ -15,6 +15,11 @@ from bodega.utils import find_bodega_dir
 
 GLOBAL_CONFIG_PATH = Path.home() / ".bodega" / "config.yaml"
 
+# Accepted values for validate_config
+_VALID_TYPES = frozenset({"bug", "feature", "task", "epic", "chore"})
+_VALID_FORMATS = frozenset({"table", "compact", "ids"})
+_PRIORITY_RANGE = range(5)
+
 DEFAULT_CONFIG_TEMPLATE = """\
 # Bodega configuration
 # See: https://github.com/bjia56/bodega
@@ -262,15 +267,13 @@ def validate_config(config: BodegaConfig) -> list[str]:
     """
     errors = []
 
-    if config.default_priority not in range(5):
+    if config.default_priority not in _PRIORITY_RANGE:
         errors.append(f"Invalid default_priority: {config.default_priority} (must be 0-4)")
 
-    valid_types = {"bug", "feature", "task", "epic", "chore"}
-    if config.default_type not in valid_types:
+    if config.default_type not in _VALID_TYPES:
         errors.append(f"Invalid default_type: {config.default_type}")
 
-    valid_formats = {"table", "compact", "ids"}
-    if config.list_format not in valid_formats:
+    if config.list_format not in _VALID_FORMATS:
         errors.append(f"Invalid list_format: {config.list_format}")
 
     return errors
@@ -1,12 +1,18 @@
 """Graph module for dependency management."""
 
-from typing import Optional
-from collections import defaultdict
+from bisect import insort
+from typing import Iterator, Optional
+from collections import defaultdict, deque
+from itertools import islice
 
 from bodega.models.ticket import Ticket, TicketStatus
 from bodega.storage import TicketStorage
 
 
+# Bound once so hot loops compare against a module global
+_CLOSED = TicketStatus.CLOSED
+
+
 # ============================================================================
 # Dependency Graph
 # ============================================================================
@@ -27,18 +33,95 @@ class DependencyGraph:
             storage: The ticket storage to load tickets from
         """
         self.storage = storage
-        self._adjacency: dict[str, set[str]] = defaultdict(set)  # id -> blockers
-        self._reverse: dict[str, set[str]] = defaultdict(set)    # id -> blocked by this
+        self._adjacency: dict[str, frozenset[str]] = {}  # id -> blockers
+        self._reverse: dict[str, frozenset[str]] = {}    # id -> blocked by this
         self._tickets: dict[str, Ticket] = {}
+        self._reverse_sorted: dict[str, list[str]] = {}  # id -> sorted children
+        self._roots: set[str] = set()                     # ids with no deps
+        self._open_ids: set[str] = set()                  # ids not closed
+        self._blocked: set[str] = set()                   # ids with an open blocker
         self._build_graph()
 
     def _build_graph(self) -> None:
-        """Build adjacency lists from all tickets."""
+        """
+        Build adjacency lists and status sets from all tickets.
+
+        A single pass over storage fills the ticket map, adjacency lists,
+        roots and open set; a second pass over tickets with deps derives
+        which ones are blocked.
+        """
+        tickets: dict[str, Ticket] = {}
+        adjacency: dict[str, frozenset[str]] = {}
+        reverse: dict[str, set[str]] = defaultdict(set)
+        roots: set[str] = set()
+        open_ids: set[str] = set()
+
         for ticket in self.storage.list_all():
-            self._tickets[ticket.id] = ticket
-            for dep_id in ticket.deps:
-                self._adjacency[ticket.id].add(dep_id)
-                self._reverse[dep_id].add(ticket.id)
+            ticket_id = ticket.id
+            deps = ticket.deps
+            tickets[ticket_id] = ticket
+            if ticket.status != _CLOSED:
+                open_ids.add(ticket_id)
+            if not deps:
+                roots.add(ticket_id)
+                continue
+            adjacency[ticket_id] = frozenset(deps)
+            for dep_id in deps:
+                reverse[dep_id].add(ticket_id)
+
+        self._tickets = tickets
+        self._adjacency = adjacency
+        self._reverse = {k: frozenset(v) for k, v in reverse.items()}
+        self._roots = roots
+        self._open_ids = open_ids
+
+        # A ticket is blocked if any of its deps is an existing, open ticket
+        self._blocked = {
+            ticket_id for ticket_id, blockers in adjacency.items()
+            if not open_ids.isdisjoint(blockers)
+        }
+
+        # Sort children once so tree rendering doesn't re-sort per node
+        self._reverse_sorted = {k: sorted(v) for k, v in reverse.items()}
+
+    # ========================================================================
+    # Mutations
+    # ========================================================================
+
+    def add_dep(
+        self,
+        ticket_id: str,
+        dep_id: str,
+        ticket: Optional[Ticket] = None
+    ) -> None:
+        """
+        Record that ticket_id now depends on dep_id without rebuilding.
+
+        Updates adjacency, reverse edges, roots and the blocked set in
+        O(degree). Does not check for cycles; call would_create_cycle()
+        first.
+
+        Args:
+            ticket_id: Ticket that gains the dependency
+            dep_id: Ticket that blocks it
+            ticket: Saved copy of the ticket to cache in place of the old one
+        """
+        if ticket is not None:
+            self._tickets[ticket_id] = ticket
+        else:
+            cached = self._tickets.get(ticket_id)
+            if cached is not None and dep_id not in cached.deps:
+                cached.deps.append(dep_id)
+
+        if dep_id in self._adjacency.get(ticket_id, ()):
+            return
+
+        self._adjacency[ticket_id] = self._adjacency.get(ticket_id, frozenset()) | {dep_id}
+        self._reverse[dep_id] = self._reverse.get(dep_id, frozenset()) | {ticket_id}
+        insort(self._reverse_sorted.setdefault(dep_id, []), ticket_id)
+        self._roots.discard(ticket_id)
+        if dep_id in self._open_ids:
+            self._blocked.add(ticket_id)
 
     # ========================================================================
     # Blocked/Ready Queries
@@ -56,15 +139,7 @@ class DependencyGraph:
         Returns:
             True if the ticket is blocked
         """
-        ticket = self._tickets.get(ticket_id)
-        if not ticket:
-            return False
-
-        for dep_id in ticket.deps:
-            dep = self._tickets.get(dep_id)
-            if dep and dep.status != TicketStatus.CLOSED:
-                return True
-        return False
+        return ticket_id in self._blocked
 
     def get_blockers(self, ticket_id: str) -> list[str]:
         """
@@ -76,16 +151,11 @@ class DependencyGraph:
         Returns:
             List of ticket IDs that are blocking this ticket
         """
-        ticket = self._tickets.get(ticket_id)
-        if not ticket:
+        if ticket_id not in self._blocked:
             return []
 
-        blockers = []
-        for dep_id in ticket.deps:
-            dep = self._tickets.get(dep_id)
-            if dep and dep.status != TicketStatus.CLOSED:
-                blockers.append(dep_id)
-        return blockers
+        open_ids = self._open_ids
+        return [dep_id for dep_id in self._tickets[ticket_id].deps if dep_id in open_ids]
 
     def get_blocked_tickets(self) -> list[Ticket]:
         """
@@ -94,13 +164,11 @@ class DependencyGraph:
         Returns:
             List of tickets that are blocked
         """
-        blocked = []
-        for ticket in self._tickets.values():
-            if ticket.status == TicketStatus.CLOSED:
-                continue
-            if self.is_blocked(ticket.id):
-                blocked.append(ticket)
-        return blocked
+        open_ids = self._open_ids
+        return [
+            ticket for ticket_id, ticket in self._tickets.items()
+            if ticket_id in self._blocked and ticket_id in open_ids
+        ]
 
     def get_ready_tickets(self) -> list[Ticket]:
         """
@@ -109,53 +177,141 @@ class DependencyGraph:
         Returns:
             List of tickets that are ready to work on
         """
-        ready = []
-        for ticket in self._tickets.values():
-            if ticket.status == TicketStatus.CLOSED:
-                continue
-            if not self.is_blocked(ticket.id):
-                ready.append(ticket)
-        return ready
+        blocked = self._blocked
+        return [
+            ticket for ticket_id, ticket in self._tickets.items()
+            if ticket_id in self._open_ids and ticket_id not in blocked
+        ]
 
     # ========================================================================
     # Cycle Detection
     # ========================================================================
 
-    def find_cycles(self) -> list[list[str]]:
+    def _iter_sccs(self) -> Iterator[list[str]]:
+        """
+        Yield strongly connected components using Tarjan's algorithm.
+
+        Runs iteratively over the adjacency lists in O(V+E). Dependencies on
+        missing tickets are ignored. Each component is yielded in discovery
+        order, so a simple cycle comes out in dependency order.
+
+        Yields:
+            Lists of ticket IDs, one per strongly connected component
         """
-        Find all dependency cycles using DFS.
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        scc_stack: list[str] = []
+
+        for start in self._tickets:
+            if start in index:
+                continue
+
+            index[start] = lowlink[start] = len(index)
+            scc_stack.append(start)
+            on_stack.add(start)
+            work = [(start, iter(self._adjacency.get(start, ())))]
+
+            while work:
+                node, neighbors = work[-1]
+
+                for neighbor in neighbors:
+                    if neighbor not in self._tickets:
+                        continue  # Skip missing tickets
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        scc_stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(self._adjacency.get(neighbor, ()))))
+                        break
+                    if neighbor in on_stack and index[neighbor] < lowlink[node]:
+                        lowlink[node] = index[neighbor]
+                else:
+                    # All neighbors explored - finish this node
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if lowlink[node] < lowlink[parent]:
+                            lowlink[parent] = lowlink[node]
+
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        component.reverse()
+                        yield component
+
+    def _is_cyclic_component(self, component: list[str]) -> bool:
+        """
+        Check whether a strongly connected component contains a cycle.
+
+        Args:
+            component: Ticket IDs in the component
 
         Returns:
-            List of cycles, where each cycle is a list of ticket IDs
+            True if the component has more than one ticket or a self-dependency
         """
-        WHITE, GRAY, BLACK = 0, 1, 2
-        color = {tid: WHITE for tid in self._tickets}
-        cycles = []
+        if len(component) > 1:
+            return True
+        node = component[0]
+        return node in self._adjacency.get(node, ())
 
-        def dfs(node: str, path: list[str]) -> None:
-            color[node] = GRAY
-            path.append(node)
+    def _cycle_through(self, start: str, component: list[str]) -> list[str]:
+        """
+        Find a shortest dependency cycle through a ticket.
 
-            for neighbor in self._adjacency.get(node, []):
-                if neighbor not in color:
-                    continue  # Skip missing tickets
+        Breadth-first search along dependency edges that stay inside the
+        ticket's strongly connected component, which guarantees a way back.
 
-                if color[neighbor] == GRAY:
-                    # Found cycle - extract it from path
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
-                elif color[neighbor] == WHITE:
-                    dfs(neighbor, path)
+        Args:
+            start: Ticket ID the cycle starts and ends at
+            component: Ticket IDs in start's cyclic component
 
-            path.pop()
-            color[node] = BLACK
+        Returns:
+            Ticket IDs along the cycle, with start repeated at the end
+        """
+        members = set(component)
+        parent: dict[str, str] = {start: start}
+        queue = deque([start])
+
+        while queue:
+            node = queue.popleft()
+            for dep in sorted(self._adjacency.get(node, ())):
+                if dep == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path + [start]
+                if dep in members and dep not in parent:
+                    parent[dep] = node
+                    queue.append(dep)
+
+        # Unreachable for a cyclic component
+        return [start, start]
+
+    def find_cycles(self) -> list[list[str]]:
+        """
+        Find dependency cycles using Tarjan's SCC algorithm.
 
-        for ticket_id in self._tickets:
-            if color[ticket_id] == WHITE:
-                dfs(ticket_id, [])
+        One cycle is reported for every strongly connected component with
+        more than one ticket (or a ticket that depends on itself): the
+        shortest loop through the component's first ticket. Each ticket
+        in the list depends on the next, and the first ID is repeated at
+        the end to close the loop.
 
-        return cycles
+        Returns:
+            List of cycles, where each cycle is a list of ticket IDs
+        """
+        return [
+            self._cycle_through(component[0], component)
+            for component in self._iter_sccs()
+            if self._is_cyclic_component(component)
+        ]
 
     def has_cycle(self) -> bool:
         """
@@ -164,7 +320,34 @@ class DependencyGraph:
         Returns:
             True if at least one cycle exists
         """
-        return len(self.find_cycles()) > 0
+        WHITE, GRAY, BLACK = 0, 1, 2
+        color = {tid: WHITE for tid in self._tickets}
+
+        # Iterative DFS that stops at the first back edge (GRAY neighbor)
+        for start in self._tickets:
+            if color[start] != WHITE:
+                continue
+
+            color[start] = GRAY
+            stack = [(start, iter(self._adjacency.get(start, ())))]
+
+            while stack:
+                node, neighbors = stack[-1]
+                neighbor = next(neighbors, None)
+
+                if neighbor is None:
+                    stack.pop()
+                    color[node] = BLACK
+                    continue
+
+                state = color.get(neighbor)
+                if state == GRAY:
+                    return True
+                if state == WHITE:
+                    color[neighbor] = GRAY
+                    stack.append((neighbor, iter(self._adjacency.get(neighbor, ()))))
+
+        return False
 
     # ========================================================================
     # Tree Visualization
@@ -188,74 +371,85 @@ class DependencyGraph:
         Returns:
             ASCII tree representation
         """
+        lines: list[str] = []
+
         if root_id:
-            return self._format_subtree(root_id, "", True)
+            self._emit_subtree(root_id, "", True, set(), lines)
+            return "\n".join(lines)
 
-        # Find all roots (tickets that have no dependencies themselves)
-        roots = [tid for tid in self._tickets if len(self._adjacency.get(tid, set())) == 0]
+        # Roots are tickets that have no dependencies themselves
+        roots = self._roots
 
         if not roots:
             # All tickets have dependencies, pick any as starting points
             # or there might be cycles
-            roots = list(self._tickets.keys())[:5]  # Limit to avoid huge output
+            roots = list(islice(self._tickets, 5))  # Limit to avoid huge output
 
-        lines = []
+        visited: set[str] = set()
         for root in sorted(roots):
-            lines.append(self._format_subtree(root, "", True))
+            self._emit_subtree(root, "", True, visited, lines)
 
         return "\n".join(lines)
 
-    def _format_subtree(
+    def _emit_subtree(
         self,
         ticket_id: str,
         prefix: str,
         is_last: bool,
-        visited: Optional[set] = None
-    ) -> str:
+        visited: set[str],
+        lines: list[str]
+    ) -> None:
         """
-        Recursively format a subtree.
+        Append the lines of a subtree to a shared output list.
+
+        Walks an explicit stack so deep trees don't recurse. Callers own
+        the output list and join it once.
 
         Args:
             ticket_id: The current ticket ID
             prefix: The prefix string for indentation
             is_last: Whether this is the last child
-            visited: Set of already visited ticket IDs (for cycle detection)
-
-        Returns:
-            Formatted subtree string
+            visited: Set of ticket IDs on the current path (for cycle detection);
+                restored to its original contents on return
+            lines: Output list that formatted lines are appended to
         """
-        if visited is None:
-            visited = set()
-
-        ticket = self._tickets.get(ticket_id)
-        if not ticket:
-            return f"{prefix}{'└── ' if is_last else '├── '}{ticket_id} (not found)"
+        # Entries are (ticket_id, prefix, is_last, leaving). A "leaving" entry
+        # is pushed below a node's children so the node is removed from
+        # visited once its subtree is done, keeping visited equal to the path.
+        stack = [(ticket_id, prefix, is_last, False)]
 
-        # Detect cycles
-        if ticket_id in visited:
-            return f"{prefix}{'└── ' if is_last else '├── '}{ticket_id} (cycle)"
+        while stack:
+            node_id, node_prefix, node_is_last, leaving = stack.pop()
+            if leaving:
+                visited.discard(node_id)
+                continue
 
-        visited = visited | {ticket_id}
+            connector = "└── " if node_is_last else "├── "
 
-        # Format this node
-        connector = "└── " if is_last else "├── "
-        status_str = f"[{ticket.status.value}]"
-        node_line = f"{prefix}{connector}{ticket_id} {status_str} {ticket.title}"
+            ticket = self._tickets.get(node_id)
+            if not ticket:
+                lines.append(f"{node_prefix}{connector}{node_id} (not found)")
+                continue
 
-        # Get children (tickets blocked by this one)
-        children = sorted(self._reverse.get(ticket_id, []))
+            # Detect cycles
+            if node_id in visited:
+                lines.append(f"{node_prefix}{connector}{node_id} (cycle)")
+                continue
 
-        if not children:
-            return node_line
+            visited.add(node_id)
 
-        lines = [node_line]
-        child_prefix = prefix + ("    " if is_last else "│   ")
+            # Format this node
+            status_str = f"[{ticket.status.value}]"
+            lines.append(f"{node_prefix}{connector}{node_id} {status_str} {ticket.title}")
+            stack.append((node_id, node_prefix, node_is_last, True))
 
-        for i, child_id in enumerate(children):
-            is_child_last = (i == len(children) - 1)
-            lines.append(self._format_subtree(child_id, child_prefix, is_child_last, visited))
-
-        return "\n".join(lines)
+            # Get children (tickets blocked by this one), pushed in reverse
+            # so they pop in sorted order
+            children = self._reverse_sorted.get(node_id, ())
+            child_prefix = node_prefix + ("    " if node_is_last else "│   ")
+            last_index = len(children) - 1
+            for i in range(last_index, -1, -1):
+                stack.append((children[i], child_prefix, i == last_index, False))
 
     # ========================================================================
     # Dependency Modification Helpers
@@ -275,21 +469,23 @@ class DependencyGraph:
             True if adding the dependency would create a cycle
         """
         # If ticket_id is reachable from new_dep_id, adding the dep creates a cycle
+        if new_dep_id == ticket_id:
+            return True
+
         visited = set()
         stack = [new_dep_id]
 
         while stack:
             current = stack.pop()
-            if current == ticket_id:
-                return True
             if current in visited:
                 continue
             visited.add(current)
 
-            # Add dependencies of current to stack
-            current_ticket = self._tickets.get(current)
-            if current_ticket:
-                stack.extend(current_ticket.deps)
+            # Check direct blockers before pushing them on the stack
+            blockers = self._adjacency.get(current, ())
+            if ticket_id in blockers:
+                return True
+            stack.extend(blockers)
 
         return False
 
@@ -301,18 +497,16 @@ class DependencyGraph:
             ticket_id: The ticket ID to check
 
         Returns:
-            List of all tickets that transitively block this one
+            Sorted list of all tickets that transitively block this one
         """
         visited = set()
-        stack = list(self._adjacency.get(ticket_id, []))
-        result = []
+        stack = list(self._adjacency.get(ticket_id, ()))
 
         while stack:
             current = stack.pop()
             if current in visited:
                 continue
             visited.add(current)
-            result.append(current)
-            stack.extend(self._adjacency.get(current, []))
+            stack.extend(self._adjacency.get(current, ()))
 
-        return result
+        return sorted(visited)
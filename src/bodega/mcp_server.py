@@ -6,7 +6,8 @@ for business logic.
 """
 
 import json
-from typing import Annotated, Optional
+from functools import lru_cache, wraps
+from typing import Annotated, Callable, Optional
 
 from zeromcp import McpServer, McpToolError
 
@@ -26,6 +27,70 @@ from bodega.errors import TicketNotFoundError, AmbiguousIDError
 from bodega.models.ticket import TicketStatus
 
 
+# ============================================================================
+# Argument Helpers
+# ============================================================================
+
+@lru_cache(maxsize=32)
+def _parse_status(status: Optional[str]) -> Optional[TicketStatus]:
+    """Parse a status filter argument.
+
+    Args:
+        status: Status string, or None/empty for no filter
+
+    Returns:
+        TicketStatus, or None if no status was given
+
+    Raises:
+        ValueError: Unknown status value
+    """
+    return TicketStatus(status) if status else None
+
+
+@lru_cache(maxsize=256)
+def _split_csv(value: str) -> tuple[str, ...]:
+    """Split a comma-separated argument into stripped items.
+
+    Args:
+        value: Comma-separated string (e.g. 'api,urgent')
+
+    Returns:
+        Tuple of items
+    """
+    return tuple(item.strip() for item in value.split(","))
+
+
+# ============================================================================
+# Error Handling
+# ============================================================================
+
+def _tool_errors(failure: str) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Decorator that converts exceptions raised by a tool into McpToolError.
+
+    Lookup and validation errors are reported as-is; anything else is
+    prefixed with the tool's failure message.
+
+    Args:
+        failure: Message prefix for unexpected errors (e.g. "Failed to close ticket")
+
+    Returns:
+        Decorator for MCP tool functions
+    """
+    def decorator(func: Callable[..., str]) -> Callable[..., str]:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> str:
+            try:
+                return func(*args, **kwargs)
+            except McpToolError:
+                raise
+            except (TicketNotFoundError, AmbiguousIDError, ValueError) as e:
+                raise McpToolError(str(e))
+            except Exception as e:
+                raise McpToolError(f"{failure}: {e}")
+        return wrapper
+    return decorator
+
+
 # ============================================================================
 # Server Factory
 # ============================================================================
@@ -47,6 +112,7 @@ def create_mcp_server(storage: TicketStorage, config: BodegaConfig) -> McpServer
     # ========================================================================
 
     @mcp.tool
+    @_tool_errors("Query failed")
     def bodega_query(
         ticket_id: Annotated[
             Optional[str],
@@ -70,36 +136,31 @@ def create_mcp_server(storage: TicketStorage, config: BodegaConfig) -> McpServer
     ) -> str:
         """Query tickets as JSON for programmatic access."""
         try:
-            status_filter = TicketStatus(status) if status else None
-            result = query_tickets(
-                storage,
-                ticket_id=ticket_id,
-                status=status_filter,
-                ticket_type=ticket_type,
-                tag=tag,
-                assignee=assignee,
-                priority=priority,
-                include_closed=include_all,
-            )
-
-            # Single ticket or list
-            if ticket_id:
-                data = ticket_to_dict(result)
-            else:
-                data = [ticket_to_dict(t) for t in result]
-
-            return json.dumps(data, indent=2, default=str)
-
-        except TicketNotFoundError as e:
-            raise McpToolError(str(e))
-        except AmbiguousIDError as e:
-            raise McpToolError(str(e))
+            status_filter = _parse_status(status)
         except ValueError as e:
             raise McpToolError(f"Invalid filter value: {e}")
-        except Exception as e:
-            raise McpToolError(f"Query failed: {e}")
+
+        result = query_tickets(
+            storage,
+            ticket_id=ticket_id,
+            status=status_filter,
+            ticket_type=ticket_type,
+            tag=tag,
+            assignee=assignee,
+            priority=priority,
+            include_closed=include_all,
+        )
+
+        # Single ticket or list
+        if ticket_id:
+            data = ticket_to_dict(result)
+        else:
+            data = [ticket_to_dict(t) for t in result]
+
+        return json.dumps(data, indent=2, default=str)
 
     @mcp.tool
+    @_tool_errors("Failed to create ticket")
     def bodega_create(
         title: Annotated[str, "Ticket title"],
         ticket_type: Annotated[
@@ -127,38 +188,33 @@ def create_mcp_server(storage: TicketStorage, config: BodegaConfig) -> McpServer
         ] = None,
     ) -> str:
         """Create a new ticket with the specified properties and returns the ticket ID."""
-        try:
-            # Parse tags and deps
-            tag_list = [t.strip() for t in tags.split(",")] if tags else None
-            dep_list = [d.strip() for d in deps.split(",")] if deps else None
-
-            ticket, missing_deps = create_ticket(
-                storage,
-                config,
-                title=title,
-                ticket_type=ticket_type,
-                priority=priority,
-                assignee=assignee,
-                tags=tag_list,
-                description=description,
-                deps=dep_list,
-                parent=parent,
-                external_ref=external_ref,
-            )
-
-            # Include warning about missing dependencies in response
-            if missing_deps:
-                warning = f"Warning: Dependencies do not exist: {', '.join(missing_deps)}"
-                return f"{ticket.id}\n{warning}"
-
-            return ticket.id
-
-        except ValueError as e:
-            raise McpToolError(str(e))
-        except Exception as e:
-            raise McpToolError(f"Failed to create ticket: {e}")
+        # Parse tags and deps
+        tag_list = list(_split_csv(tags)) if tags else None
+        dep_list = list(_split_csv(deps)) if deps else None
+
+        ticket, missing_deps = create_ticket(
+            storage,
+            config,
+            title=title,
+            ticket_type=ticket_type,
+            priority=priority,
+            assignee=assignee,
+            tags=tag_list,
+            description=description,
+            deps=dep_list,
+            parent=parent,
+            external_ref=external_ref,
+        )
+
+        # Include warning about missing dependencies in response
+        if missing_deps:
+            warning = f"Warning: Dependencies do not exist: {', '.join(missing_deps)}"
+            return f"{ticket.id}\n{warning}"
+
+        return ticket.id
 
     @mcp.tool
+    @_tool_errors("Failed to start ticket")
     def bodega_start(
         ticket_id: Annotated[
             str,
@@ -170,93 +226,62 @@ def create_mcp_server(storage: TicketStorage, config: BodegaConfig) -> McpServer
         ] = None,
     ) -> str:
         """Set ticket status to in-progress."""
-        try:
-            ticket, already_in_progress = start_ticket(
-                storage, config, ticket_id, assignee
-            )
-
-            if already_in_progress and assignee is None:
-                return f"{ticket.id} is already in-progress"
+        ticket, already_in_progress = start_ticket(
+            storage, config, ticket_id, assignee
+        )
 
-            if already_in_progress:
-                return f"Updated {ticket.id}"
-            return f"{ticket.id} → in-progress"
+        if already_in_progress and assignee is None:
+            return f"{ticket.id} is already in-progress"
 
-        except TicketNotFoundError as e:
-            raise McpToolError(str(e))
-        except AmbiguousIDError as e:
-            raise McpToolError(str(e))
-        except Exception as e:
-            raise McpToolError(f"Failed to start ticket: {e}")
+        if already_in_progress:
+            return f"Updated {ticket.id}"
+        return f"{ticket.id} → in-progress"
 
     @mcp.tool
+    @_tool_errors("Failed to close ticket")
     def bodega_close(
         ticket_id: Annotated[str, "Ticket ID"],
     ) -> str:
         """Set ticket status to closed."""
-        try:
-            ticket, already_closed = close_ticket(storage, ticket_id)
-
-            if already_closed:
-                return f"{ticket.id} is already closed"
-            return f"{ticket.id} → closed"
+        ticket, already_closed = close_ticket(storage, ticket_id)
 
-        except TicketNotFoundError as e:
-            raise McpToolError(str(e))
-        except AmbiguousIDError as e:
-            raise McpToolError(str(e))
-        except Exception as e:
-            raise McpToolError(f"Failed to close ticket: {e}")
+        if already_closed:
+            return f"{ticket.id} is already closed"
+        return f"{ticket.id} → closed"
 
     @mcp.tool
+    @_tool_errors("Failed to add note")
     def bodega_note(
         ticket_id: Annotated[str, "Ticket ID"],
         text: Annotated[str, "Note text"],
     ) -> str:
         """Add a timestamped note to a ticket."""
-        try:
-            ticket = add_note(storage, ticket_id, text)
-            return f"Added note to {ticket.id}"
-
-        except TicketNotFoundError as e:
-            raise McpToolError(str(e))
-        except AmbiguousIDError as e:
-            raise McpToolError(str(e))
-        except Exception as e:
-            raise McpToolError(f"Failed to add note: {e}")
+        ticket = add_note(storage, ticket_id, text)
+        return f"Added note to {ticket.id}"
 
     # ========================================================================
     # Medium Priority Tools - Enhanced Functionality
     # ========================================================================
 
     @mcp.tool
+    @_tool_errors("Failed to show ticket")
     def bodega_show(
         ticket_id: Annotated[str, "Ticket ID"],
     ) -> str:
         """Display detailed ticket information in formatted text."""
-        try:
-            ticket = query_tickets(storage, ticket_id=ticket_id)
-            return format_ticket_detail(ticket, config)
-
-        except TicketNotFoundError as e:
-            raise McpToolError(str(e))
-        except AmbiguousIDError as e:
-            raise McpToolError(str(e))
-        except Exception as e:
-            raise McpToolError(f"Failed to show ticket: {e}")
+        ticket = query_tickets(storage, ticket_id=ticket_id)
+        return format_ticket_detail(ticket, config)
 
     @mcp.tool
+    @_tool_errors("Failed to get ready tickets")
     def bodega_ready() -> str:
         """List open tickets with no unresolved dependencies, sorted by priority."""
-        try:
-            tickets = get_ready_tickets(storage)
-            data = [ticket_to_dict(t) for t in tickets]
-            return json.dumps(data, indent=2, default=str)
-
-        except Exception as e:
-            raise McpToolError(f"Failed to get ready tickets: {e}")
+        tickets = get_ready_tickets(storage, storage.dependency_graph())
+        data = [ticket_to_dict(t) for t in tickets]
+        return json.dumps(data, indent=2, default=str)
 
     @mcp.tool
+    @_tool_errors("Failed to add dependency")
     def bodega_dep(
         ticket_id: Annotated[
             str,
@@ -268,23 +293,13 @@ def create_mcp_server(storage: TicketStorage, config: BodegaConfig) -> McpServer
         ],
     ) -> str:
         """Add a dependency (BLOCKER blocks ID)."""
-        try:
-            ticket, blocker, already_dep = add_dependency(
-                storage, ticket_id, blocker_id
-            )
-
-            if already_dep:
-                return f"{ticket.id} already depends on {blocker.id}"
-            return f"{ticket.id} now depends on {blocker.id}"
-
-        except TicketNotFoundError as e:
-            raise McpToolError(str(e))
-        except AmbiguousIDError as e:
-            raise McpToolError(str(e))
-        except ValueError as e:
-            raise McpToolError(str(e))
-        except Exception as e:
-            raise McpToolError(f"Failed to add dependency: {e}")
+        ticket, blocker, already_dep = add_dependency(
+            storage, ticket_id, blocker_id, storage.dependency_graph()
+        )
+
+        if already_dep:
+            return f"{ticket.id} already depends on {blocker.id}"
+        return f"{ticket.id} now depends on {blocker.id}"
 
     return mcp
 
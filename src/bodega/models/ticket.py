@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from enum import Enum
+from functools import lru_cache
+import re
 import frontmatter
 
 from bodega.utils import now_utc, is_valid_id, id_pattern
@@ -21,7 +23,118 @@ class TicketStatus(str, Enum):
     CLOSED = "closed"
 
 
-@dataclass
+# Body sections that map to Ticket fields, keyed by normalized heading
+_RECOGNIZED_SECTIONS = frozenset({
+    "description",
+    "design",
+    "acceptance_criteria",
+    "notes",
+})
+
+# Level-two markdown headings, matched line by line
+_HEADING_RE = re.compile(r"^## (.*)$", re.MULTILINE)
+
+# "- " list items in the notes section, ignoring surrounding whitespace
+# (but never crossing a line break)
+_NOTE_RE = re.compile(r"^[^\S\n]*- (.*\S)[^\S\n]*$", re.MULTILINE)
+
+
+# Strings PyYAML writes unquoted: ASCII, starting with a letter, no YAML
+# indicators. Anything else goes through the full dumper.
+_PLAIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9 _./()+,'!?-]*")
+
+# Words YAML 1.1 resolves to booleans or null when left unquoted
+_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+
+# isoformat() output, which PyYAML single-quotes so it stays a string
+_ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.\d+)?(?:[+-]\d\d:\d\d)?")
+
+# PyYAML folds plain scalars past this column
+_YAML_WIDTH = 80
+
+
+def _format_yaml_scalar(value: object, indent: int) -> Optional[str]:
+    """
+    Format a frontmatter scalar exactly as PyYAML's safe dumper would.
+
+    Args:
+        value: The value to format
+        indent: Column the value starts at, for line width checks
+
+    Returns:
+        The YAML text, or None if the value needs the full dumper
+    """
+    if type(value) is int:
+        return str(value)
+    if type(value) is not str or indent + len(value) > _YAML_WIDTH:
+        return None
+    if _PLAIN_RE.fullmatch(value):
+        if value.endswith(" ") or "  " in value or value.lower() in _RESERVED_WORDS:
+            return None
+        return value
+    if _ISO_TIMESTAMP_RE.fullmatch(value):
+        return f"'{value}'"
+    return None
+
+
+def _format_yaml_mapping(metadata: dict) -> Optional[str]:
+    """
+    Format a flat mapping exactly as PyYAML's safe block-style dumper would.
+
+    Args:
+        metadata: Mapping of keys to scalars or non-empty lists of scalars
+
+    Returns:
+        The YAML text, or None if any value needs the full dumper
+    """
+    lines = []
+    for key in sorted(metadata):
+        value = metadata[key]
+        if type(value) is list:
+            if not value:
+                return None
+            lines.append(f"{key}:")
+            for item in value:
+                formatted = _format_yaml_scalar(item, 2)
+                if formatted is None:
+                    return None
+                lines.append(f"- {formatted}")
+        else:
+            formatted = _format_yaml_scalar(value, len(key) + 2)
+            if formatted is None:
+                return None
+            lines.append(f"{key}: {formatted}")
+    return "\n".join(lines)
+
+
+def _dump_frontmatter(metadata: dict, content: str) -> str:
+    """
+    Serialize metadata and content the way frontmatter.dumps does.
+
+    Ticket frontmatter is a small fixed schema of short strings, ints and
+    string lists, so it is usually written directly; anything outside
+    that goes through frontmatter/PyYAML instead.
+
+    Args:
+        metadata: Frontmatter fields
+        content: Markdown body
+
+    Returns:
+        The full markdown document
+    """
+    header = _format_yaml_mapping(metadata)
+    if header is None:
+        return frontmatter.dumps(frontmatter.Post(content, **metadata))
+    return f"---\n{header}\n---\n\n{content}".strip()
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO format timestamp; tickets often share identical values."""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class Ticket:
     id: str
     title: str
@@ -66,63 +179,49 @@ class Ticket:
 
     def to_frontmatter(self) -> dict:
         """Convert ticket metadata to frontmatter dict."""
-        fm = {
+        # Optional fields are only written when they have values
+        optional = (
+            ("assignee", self.assignee),
+            ("tags", self.tags),
+            ("deps", self.deps),
+            ("links", self.links),
+            ("parent", self.parent),
+            ("external_ref", self.external_ref),
+        )
+
+        return {
             "id": self.id,
             "title": self.title,
             "type": self.type.value,
             "status": self.status.value,
             "priority": self.priority,
+            **{key: value for key, value in optional if value},
+            # Timestamps as ISO format strings
+            "created": self.created.isoformat(),
+            "updated": self.updated.isoformat(),
         }
 
-        # Add optional fields only if they have values
-        if self.assignee:
-            fm["assignee"] = self.assignee
-        if self.tags:
-            fm["tags"] = self.tags
-        if self.deps:
-            fm["deps"] = self.deps
-        if self.links:
-            fm["links"] = self.links
-        if self.parent:
-            fm["parent"] = self.parent
-        if self.external_ref:
-            fm["external_ref"] = self.external_ref
-
-        # Add timestamps as ISO format strings
-        fm["created"] = self.created.isoformat()
-        fm["updated"] = self.updated.isoformat()
-
-        return fm
-
     def to_markdown(self) -> str:
         """Convert full ticket to markdown string with frontmatter."""
-        # Build the content sections
-        content_parts = []
+        # Build the content sections, each already formatted in full
+        sections = []
 
         if self.description:
-            content_parts.append("## Description\n")
-            content_parts.append(f"{self.description}\n")
+            sections.append(f"## Description\n\n{self.description}\n")
 
         if self.design:
-            content_parts.append("## Design\n")
-            content_parts.append(f"{self.design}\n")
+            sections.append(f"## Design\n\n{self.design}\n")
 
         if self.acceptance_criteria:
-            content_parts.append("## Acceptance Criteria\n")
-            content_parts.append(f"{self.acceptance_criteria}\n")
+            sections.append(f"## Acceptance Criteria\n\n{self.acceptance_criteria}\n")
 
         if self.notes:
-            content_parts.append("## Notes\n")
-            for note in self.notes:
-                content_parts.append(f"- {note}\n")
-
-        content = "\n".join(content_parts).strip()
+            notes = "\n".join([f"- {note}\n" for note in self.notes])
+            sections.append(f"## Notes\n\n{notes}")
 
-        # Create frontmatter post
-        post = frontmatter.Post(content, **self.to_frontmatter())
+        content = "\n".join(sections).strip()
 
-        # Convert to string with frontmatter
-        return frontmatter.dumps(post)
+        return _dump_frontmatter(self.to_frontmatter(), content)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Ticket":
@@ -142,18 +241,12 @@ class Ticket:
             "external_ref": data.get("external_ref"),
         }
 
-        # Parse timestamps
-        if "created" in data:
-            if isinstance(data["created"], str):
-                ticket_data["created"] = datetime.fromisoformat(data["created"])
-            else:
-                ticket_data["created"] = data["created"]
-
-        if "updated" in data:
-            if isinstance(data["updated"], str):
-                ticket_data["updated"] = datetime.fromisoformat(data["updated"])
-            else:
-                ticket_data["updated"] = data["updated"]
+        # Parse timestamps (strings as written by to_frontmatter, or datetimes
+        # if YAML resolved an unquoted, hand-edited value)
+        for key in ("created", "updated"):
+            if key in data:
+                value = data[key]
+                ticket_data[key] = _parse_timestamp(value) if type(value) is str else value
 
         # Extract content sections from the content string
         content = data.get("content", "")
@@ -161,38 +254,26 @@ class Ticket:
             # Parse content sections - recognized headers act as section boundaries
             # Everything under a section (including sub-headings) belongs to that section
             # until the next recognized section header appears
-            RECOGNIZED_SECTIONS = {
-                "description": "description",
-                "design": "design",
-                "acceptance_criteria": "acceptance_criteria",
-                "notes": "notes",
-            }
-
             sections = {}
             current_section = None
-            current_content = []
-
-            for line in content.split("\n"):
-                if line.startswith("## "):
-                    # Check if this is a recognized section header
-                    heading = line[3:].strip().lower().replace(" ", "_")
-
-                    if heading in RECOGNIZED_SECTIONS:
-                        # Save previous section
-                        if current_section:
-                            sections[current_section] = "\n".join(current_content).strip()
-                        # Start new recognized section
-                        current_section = RECOGNIZED_SECTIONS[heading]
-                        current_content = []
-                    elif current_section:
-                        # Unrecognized heading - include it in current section content
-                        current_content.append(line)
-                elif current_section:
-                    current_content.append(line)
+            body_start = 0
+
+            for match in _HEADING_RE.finditer(content):
+                heading = match.group(1).strip().lower().replace(" ", "_")
+                if heading not in _RECOGNIZED_SECTIONS:
+                    # Unrecognized heading - left in the current section's text
+                    continue
+
+                # Save previous section
+                if current_section:
+                    sections[current_section] = content[body_start:match.start()].strip()
+                # Start new recognized section after the heading line
+                current_section = heading
+                body_start = match.end() + 1
 
             # Save last section
             if current_section:
-                sections[current_section] = "\n".join(current_content).strip()
+                sections[current_section] = content[body_start:].strip()
 
             # Map sections to ticket fields
             ticket_data["description"] = sections.get("description")
@@ -201,13 +282,7 @@ class Ticket:
 
             # Parse notes if present
             if "notes" in sections:
-                notes_text = sections["notes"]
-                notes = []
-                for line in notes_text.split("\n"):
-                    line = line.strip()
-                    if line.startswith("- "):
-                        notes.append(line[2:])
-                ticket_data["notes"] = notes
+                ticket_data["notes"] = _NOTE_RE.findall(sections["notes"])
 
         return cls(**ticket_data)
 
@@ -218,6 +293,6 @@ class Ticket:
 
     def add_note(self, text: str) -> None:
         """Add a timestamped note."""
-        timestamp = now_utc().strftime("%Y-%m-%d %H:%M")
-        self.notes.append(f"{timestamp}: {text}")
-        self.updated = now_utc()
+        now = now_utc()
+        self.notes.append(f"{now:%Y-%m-%d %H:%M}: {text}")
+        self.updated = now
@@ -4,6 +4,7 @@ This module provides the core business logic for ticket operations,
 separated from presentation (CLI) and protocol (MCP) concerns.
 """
 
+from operator import attrgetter
 from typing import Optional
 
 from bodega.storage import TicketStorage
@@ -59,18 +60,23 @@ def query_tickets(
     ))
 
 
-def get_ready_tickets(storage: TicketStorage) -> list[Ticket]:
+def get_ready_tickets(
+    storage: TicketStorage,
+    graph: Optional[DependencyGraph] = None,
+) -> list[Ticket]:
     """Get tickets ready to work on (no unresolved dependencies).
 
     Args:
         storage: TicketStorage instance
+        graph: Already-built DependencyGraph to reuse (built from storage if None)
 
     Returns:
         List of ready tickets sorted by priority
     """
-    graph = DependencyGraph(storage)
+    if graph is None:
+        graph = DependencyGraph(storage)
     tickets = graph.get_ready_tickets()
-    tickets.sort(key=lambda t: (t.priority, t.created))
+    tickets.sort(key=attrgetter("priority", "created"))
     return tickets
 
 
@@ -145,7 +151,7 @@ def create_ticket(
     # Check for missing dependencies (warning, not error)
     missing_deps = []
     if deps:
-        all_ids = storage.list_ids()
+        all_ids = set(storage.list_ids())
         missing_deps = [d for d in deps if d not in all_ids]
 
     created = storage.create(ticket)
@@ -307,35 +313,43 @@ def edit_ticket(
     ticket = storage.get(ticket_id)
     modified = False
 
-    if title is not None:
+    # Only count changes that actually differ, so no-op edits skip the save
+    if title is not None and title != ticket.title:
         ticket.title = title
         modified = True
 
     if ticket_type is not None:
-        ticket.type = TicketType(ticket_type)
-        modified = True
+        new_type = TicketType(ticket_type)
+        if new_type != ticket.type:
+            ticket.type = new_type
+            modified = True
 
-    if priority is not None:
+    if priority is not None and priority != ticket.priority:
         ticket.priority = priority
         modified = True
 
     if assignee is not None:
-        ticket.assignee = assignee if assignee else None
-        modified = True
+        new_assignee = assignee if assignee else None
+        if new_assignee != ticket.assignee:
+            ticket.assignee = new_assignee
+            modified = True
 
     if add_tags:
+        existing = set(ticket.tags)
         for t in add_tags:
-            if t not in ticket.tags:
+            if t not in existing:
                 ticket.tags.append(t)
-        modified = True
+                existing.add(t)
+                modified = True
 
     if remove_tags:
-        for t in remove_tags:
-            if t in ticket.tags:
-                ticket.tags.remove(t)
-        modified = True
+        removed = set(remove_tags)
+        kept = [t for t in ticket.tags if t not in removed]
+        if len(kept) != len(ticket.tags):
+            ticket.tags = kept
+            modified = True
 
-    if description is not None:
+    if description is not None and description != ticket.description:
         ticket.description = description
         modified = True
 
@@ -354,6 +368,7 @@ def add_dependency(
     storage: TicketStorage,
     ticket_id: str,
     blocker_id: str,
+    graph: Optional[DependencyGraph] = None,
 ) -> tuple[Ticket, Ticket, bool]:
     """Add a dependency (blocker blocks ticket).
 
@@ -361,6 +376,8 @@ def add_dependency(
         storage: TicketStorage instance
         ticket_id: Ticket ID that has the dependency
         blocker_id: Blocker ticket ID that must be closed first
+        graph: Already-built DependencyGraph to check and update in place
+            (if None, only the tickets reachable from blocker are read)
 
     Returns:
         Tuple of (ticket, blocker, was_already_dependency)
@@ -382,16 +399,53 @@ def add_dependency(
         return ticket, blocker, True
 
     # Check for cycle
-    graph = DependencyGraph(storage)
-    if graph.would_create_cycle(ticket.id, blocker.id):
+    if graph is not None:
+        creates_cycle = graph.would_create_cycle(ticket.id, blocker.id)
+    else:
+        creates_cycle = _depends_on(storage, blocker.id, ticket.id)
+    if creates_cycle:
         raise ValueError("Adding this dependency would create a cycle")
 
     # Add dependency
     ticket.deps.append(blocker.id)
     storage.save(ticket)
+    if graph is not None:
+        graph.add_dep(ticket.id, blocker.id, ticket)
+        storage.dependency_graph_updated(graph)
     return ticket, blocker, False
 
 
+def _depends_on(storage: TicketStorage, start_id: str, target_id: str) -> bool:
+    """Check whether start_id transitively depends on target_id.
+
+    Walks deps from start_id, reading only the tickets it reaches rather
+    than building a full DependencyGraph. Deps on missing tickets are
+    ignored, as in the graph.
+
+    Args:
+        storage: TicketStorage instance
+        start_id: Ticket ID to walk from
+        target_id: Ticket ID to look for
+
+    Returns:
+        True if target_id is reachable from start_id
+    """
+    known_ids = set(storage.list_ids())
+    visited = {start_id}
+    stack = [start_id]
+
+    while stack:
+        current = stack.pop()
+        for dep_id in storage.get(current).deps:
+            if dep_id == target_id:
+                return True
+            if dep_id not in visited and dep_id in known_ids:
+                visited.add(dep_id)
+                stack.append(dep_id)
+
+    return False
+
+
 def remove_dependency(
     storage: TicketStorage,
     ticket_id: str,
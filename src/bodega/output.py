@@ -1,9 +1,10 @@
 """Output formatting module."""
 
+import io
 import json
 import sys
 import os
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional, TextIO
 
 from bodega.models.ticket import Ticket, TicketStatus, TicketType
 from bodega.config import BodegaConfig
@@ -28,6 +29,9 @@ class Colors:
     MAGENTA = "\033[35m"
     CYAN = "\033[36m"
 
+    # Cached result of enabled(), None until first checked
+    _enabled: Optional[bool] = None
+
     @classmethod
     def enabled(cls) -> bool:
         """
@@ -37,10 +41,20 @@ class Colors:
         - stdout is a TTY
         - NO_COLOR environment variable is not set
 
+        The result is computed once per process; call reset_color_cache()
+        after redirecting stdout or changing NO_COLOR.
+
         Returns:
             True if colors should be enabled
         """
-        return sys.stdout.isatty() and "NO_COLOR" not in os.environ
+        if cls._enabled is None:
+            cls._enabled = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+        return cls._enabled
+
+
+def reset_color_cache() -> None:
+    """Forget the cached Colors.enabled() result so it is re-checked."""
+    Colors._enabled = None
 
 
 def colorize(text: str, color: str) -> str:
@@ -59,10 +73,49 @@ def colorize(text: str, color: str) -> str:
     return text
 
 
+def _render(write: Callable[..., None], *args, **kwargs) -> str:
+    """
+    Capture a write_* formatter's output as a string.
+
+    Args:
+        write: Streaming formatter taking an ``out`` keyword argument
+        *args: Positional arguments for the formatter
+        **kwargs: Keyword arguments for the formatter
+
+    Returns:
+        The written text without its final newline
+    """
+    buf = io.StringIO()
+    write(*args, out=buf, **kwargs)
+    return buf.getvalue()[:-1]
+
+
 # ============================================================================
 # Color Helpers
 # ============================================================================
 
+_STATUS_COLORS = {
+    TicketStatus.OPEN: Colors.YELLOW,
+    TicketStatus.IN_PROGRESS: Colors.BLUE,
+    TicketStatus.CLOSED: Colors.GREEN,
+}
+
+# Indexed by priority; anything past the end (3, 4) is dimmed
+_PRIORITY_COLORS = (
+    Colors.RED + Colors.BOLD,
+    Colors.RED,
+    "",  # normal, no color
+)
+
+_TYPE_COLORS = {
+    TicketType.BUG: Colors.RED,
+    TicketType.FEATURE: Colors.GREEN,
+    TicketType.TASK: Colors.BLUE,
+    TicketType.EPIC: Colors.MAGENTA,
+    TicketType.CHORE: Colors.DIM,
+}
+
+
 def status_color(status: TicketStatus) -> str:
     """
     Get color for a status.
@@ -73,11 +126,7 @@ def status_color(status: TicketStatus) -> str:
     Returns:
         ANSI color code for the status
     """
-    return {
-        TicketStatus.OPEN: Colors.YELLOW,
-        TicketStatus.IN_PROGRESS: Colors.BLUE,
-        TicketStatus.CLOSED: Colors.GREEN,
-    }.get(status, "")
+    return _STATUS_COLORS.get(status, "")
 
 
 def priority_color(priority: int) -> str:
@@ -90,14 +139,9 @@ def priority_color(priority: int) -> str:
     Returns:
         ANSI color code for the priority
     """
-    if priority == 0:
-        return Colors.RED + Colors.BOLD
-    elif priority == 1:
-        return Colors.RED
-    elif priority == 2:
-        return ""  # normal, no color
-    else:
-        return Colors.DIM
+    if 0 <= priority < len(_PRIORITY_COLORS):
+        return _PRIORITY_COLORS[priority]
+    return Colors.DIM
 
 
 def type_color(ticket_type: TicketType) -> str:
@@ -110,13 +154,7 @@ def type_color(ticket_type: TicketType) -> str:
     Returns:
         ANSI color code for the type
     """
-    return {
-        TicketType.BUG: Colors.RED,
-        TicketType.FEATURE: Colors.GREEN,
-        TicketType.TASK: Colors.BLUE,
-        TicketType.EPIC: Colors.MAGENTA,
-        TicketType.CHORE: Colors.DIM,
-    }.get(ticket_type, "")
+    return _TYPE_COLORS.get(ticket_type, "")
 
 
 # ============================================================================
@@ -144,29 +182,61 @@ def format_table(
     Returns:
         Formatted table as a string
     """
+    return _render(write_table, tickets, config, show_header=show_header)
+
+
+def write_table(
+    tickets: Iterable[Ticket],
+    config: BodegaConfig,
+    out: Optional[TextIO] = None,
+    show_header: bool = True
+) -> None:
+    """
+    Write tickets as a table, one row at a time.
+
+    Writes the same text as format_table() followed by a newline.
+
+    Args:
+        tickets: Tickets to format
+        config: Bodega configuration
+        out: Stream to write to (default: sys.stdout)
+        show_header: Whether to show column headers
+    """
+    out = out or sys.stdout
     tickets = list(tickets)
     if not tickets:
-        return "No tickets found."
-
-    lines = []
+        out.write("No tickets found.\n")
+        return
 
     # Header
     if show_header:
         header = f"{'ID':<12} {'TYPE':<8} {'PRI':<4} {'STATUS':<12} TITLE"
-        lines.append(colorize(header, Colors.BOLD))
+        out.write(colorize(header, Colors.BOLD) + "\n")
+
+    # Padded, colorized cells only depend on the value, so build each once
+    type_cells = {tt: colorize(tt.value.ljust(8), type_color(tt)) for tt in TicketType}
+    status_cells = {st: colorize(st.value.ljust(12), status_color(st)) for st in TicketStatus}
+    pri_cells: dict[int, str] = {}
 
-    # Rows
+    # Rows (attributes and bound methods read once into locals)
+    write = out.write
     for t in tickets:
-        type_str = colorize(f"{t.type.value:<8}", type_color(t.type))
-        pri_str = colorize(f"{t.priority:<4}", priority_color(t.priority))
-        status_str = colorize(f"{t.status.value:<12}", status_color(t.status))
+        priority = t.priority
+        pri_str = pri_cells.get(priority)
+        if pri_str is None:
+            pri_str = pri_cells[priority] = colorize(
+                str(priority).ljust(4), priority_color(priority)
+            )
 
         # Truncate title if needed
-        title = t.title[:50] + "..." if len(t.title) > 53 else t.title
+        title = t.title
+        if len(title) > 53:
+            title = title[:50] + "..."
 
-        lines.append(f"{t.id:<12} {type_str} {pri_str} {status_str} {title}")
-
-    return "\n".join(lines)
+        write(
+            f"{t.id.ljust(12)} {type_cells[t.type]} {pri_str} "
+            f"{status_cells[t.status]} {title}\n"
+        )
 
 
 # ============================================================================
@@ -188,11 +258,36 @@ def format_compact(tickets: Iterable[Ticket], config: BodegaConfig) -> str:
     Returns:
         Formatted compact list as a string
     """
-    lines = []
+    return _render(write_compact, tickets, config)
+
+
+def write_compact(
+    tickets: Iterable[Ticket],
+    config: BodegaConfig,
+    out: Optional[TextIO] = None
+) -> None:
+    """
+    Write tickets in compact one-line format, one line at a time.
+
+    Writes the same text as format_compact() followed by a newline.
+
+    Args:
+        tickets: Tickets to format
+        config: Bodega configuration
+        out: Stream to write to (default: sys.stdout)
+    """
+    out = out or sys.stdout
+    labels: dict[tuple[TicketType, int], str] = {}
     for t in tickets:
-        type_pri = colorize(f"[{t.type.value}/{t.priority}]", type_color(t.type))
-        lines.append(f"{t.id} {type_pri} {t.title}")
-    return "\n".join(lines) if lines else "No tickets found."
+        key = (t.type, t.priority)
+        type_pri = labels.get(key)
+        if type_pri is None:
+            type_pri = labels[key] = colorize(
+                f"[{t.type.value}/{t.priority}]", type_color(t.type)
+            )
+        out.write(f"{t.id} {type_pri} {t.title}\n")
+    if not labels:
+        out.write("No tickets found.\n")
 
 
 # ============================================================================
@@ -210,14 +305,42 @@ def format_ids(tickets: Iterable[Ticket], config: BodegaConfig) -> str:
     Returns:
         Newline-separated list of IDs
     """
-    ids = [t.id for t in tickets]
-    return "\n".join(ids) if ids else ""
+    return _render(write_ids, tickets, config)
+
+
+def write_ids(
+    tickets: Iterable[Ticket],
+    config: BodegaConfig,
+    out: Optional[TextIO] = None
+) -> None:
+    """
+    Write IDs only, one per line.
+
+    Writes the same text as format_ids() followed by a newline.
+
+    Args:
+        tickets: Tickets to format
+        config: Bodega configuration
+        out: Stream to write to (default: sys.stdout)
+    """
+    out = out or sys.stdout
+    empty = True
+    for t in tickets:
+        out.write(t.id + "\n")
+        empty = False
+    if empty:
+        out.write("\n")
 
 
 # ============================================================================
 # JSON Format
 # ============================================================================
 
+# Shared encoders, configured like json.dumps(..., default=str)
+_JSON_PRETTY = json.JSONEncoder(indent=2, default=str)
+_JSON_COMPACT = json.JSONEncoder(default=str)
+
+
 def format_json(
     tickets: Iterable[Ticket],
     config: BodegaConfig,
@@ -234,10 +357,46 @@ def format_json(
     Returns:
         JSON string
     """
-    data = [ticket_to_dict(t) for t in tickets]
+    return _render(write_json, tickets, config, pretty=pretty)
+
+
+def write_json(
+    tickets: Iterable[Ticket],
+    config: BodegaConfig,
+    out: Optional[TextIO] = None,
+    pretty: bool = True
+) -> None:
+    """
+    Write tickets as a JSON array, one ticket at a time.
+
+    Writes the same text as format_json() followed by a newline.
+
+    Args:
+        tickets: Tickets to format
+        config: Bodega configuration
+        out: Stream to write to (default: sys.stdout)
+        pretty: Whether to pretty-print the JSON
+    """
+    out = out or sys.stdout
+    write = out.write
+
+    # JSON strings never contain raw newlines, so indenting an encoded item
+    # by replacing them matches what json.dumps does for a nested object.
     if pretty:
-        return json.dumps(data, indent=2, default=str)
-    return json.dumps(data, default=str)
+        sep = "[\n  "
+        for t in tickets:
+            write(sep)
+            write(_JSON_PRETTY.encode(ticket_to_dict(t)).replace("\n", "\n  "))
+            sep = ",\n  "
+        write("[]\n" if sep == "[\n  " else "\n]\n")
+        return
+
+    sep = "["
+    for t in tickets:
+        write(sep)
+        write(_JSON_COMPACT.encode(ticket_to_dict(t)))
+        sep = ", "
+    write("[]\n" if sep == "[" else "]\n")
 
 
 def ticket_to_dict(ticket: Ticket) -> dict:
@@ -288,57 +447,38 @@ def format_ticket_detail(ticket: Ticket, config: BodegaConfig) -> str:
     Returns:
         Formatted ticket details as a string
     """
-    lines = []
-
-    # Header
-    status_colored = colorize(ticket.status.value, status_color(ticket.status))
-    type_colored = colorize(ticket.type.value, type_color(ticket.type))
-    lines.append(colorize(f"[{ticket.id}]", Colors.BOLD) + f" {ticket.title}")
-    lines.append("")
-
-    # Metadata
-    lines.append(f"Type:     {type_colored}")
-    lines.append(f"Status:   {status_colored}")
-    lines.append(f"Priority: {ticket.priority}")
-    if ticket.assignee:
-        lines.append(f"Assignee: {ticket.assignee}")
-    if ticket.tags:
-        lines.append(f"Tags:     {', '.join(ticket.tags)}")
-    if ticket.deps:
-        lines.append(f"Blocked by: {', '.join(ticket.deps)}")
-    if ticket.links:
-        lines.append(f"Linked to:  {', '.join(ticket.links)}")
-    if ticket.parent:
-        lines.append(f"Parent:   {ticket.parent}")
-    if ticket.external_ref:
-        lines.append(f"External: {ticket.external_ref}")
-
-    lines.append(f"Created:  {format_datetime(ticket.created, config.date_format)}")
-    lines.append(f"Updated:  {format_datetime(ticket.updated, config.date_format)}")
-
-    # Content sections
-    if ticket.description:
-        lines.append("")
-        lines.append(colorize("## Description", Colors.BOLD))
-        lines.append(ticket.description)
-
-    if ticket.design:
-        lines.append("")
-        lines.append(colorize("## Design", Colors.BOLD))
-        lines.append(ticket.design)
-
-    if ticket.acceptance_criteria:
-        lines.append("")
-        lines.append(colorize("## Acceptance Criteria", Colors.BOLD))
-        lines.append(ticket.acceptance_criteria)
-
-    if ticket.notes:
-        lines.append("")
-        lines.append(colorize("## Notes", Colors.BOLD))
-        for note in ticket.notes:
-            lines.append(f"- {note}")
-
-    return "\n".join(lines)
+    def section(heading: str, body: Optional[str]) -> Optional[str]:
+        # Blank line, bold heading, body; omitted when the body is empty
+        if not body:
+            return None
+        return f"\n{colorize(f'## {heading}', Colors.BOLD)}\n{body}"
+
+    date_format = config.date_format
+    parts = [
+        # Header, followed by a blank line
+        colorize(f"[{ticket.id}]", Colors.BOLD) + f" {ticket.title}\n",
+
+        # Metadata
+        f"Type:     {colorize(ticket.type.value, type_color(ticket.type))}",
+        f"Status:   {colorize(ticket.status.value, status_color(ticket.status))}",
+        f"Priority: {ticket.priority}",
+        ticket.assignee and f"Assignee: {ticket.assignee}",
+        ticket.tags and f"Tags:     {', '.join(ticket.tags)}",
+        ticket.deps and f"Blocked by: {', '.join(ticket.deps)}",
+        ticket.links and f"Linked to:  {', '.join(ticket.links)}",
+        ticket.parent and f"Parent:   {ticket.parent}",
+        ticket.external_ref and f"External: {ticket.external_ref}",
+        f"Created:  {format_datetime(ticket.created, date_format)}",
+        f"Updated:  {format_datetime(ticket.updated, date_format)}",
+
+        # Content sections
+        section("Description", ticket.description),
+        section("Design", ticket.design),
+        section("Acceptance Criteria", ticket.acceptance_criteria),
+        section("Notes", "\n".join(f"- {note}" for note in ticket.notes)),
+    ]
+
+    return "\n".join(filter(None, parts))
 
 
 # ============================================================================
@@ -361,16 +501,37 @@ def format_tickets(
     Returns:
         Formatted output as a string
     """
+    return _render(write_tickets, tickets, config, fmt)
+
+
+def write_tickets(
+    tickets: Iterable[Ticket],
+    config: BodegaConfig,
+    fmt: Optional[str] = None,
+    out: Optional[TextIO] = None
+) -> None:
+    """
+    Write tickets using the specified or configured format.
+
+    Writes the same text as format_tickets() followed by a newline,
+    streaming rows instead of building the whole listing first.
+
+    Args:
+        tickets: Tickets to format
+        config: Bodega configuration
+        fmt: Format override (table, compact, ids, json). If None, uses config.list_format
+        out: Stream to write to (default: sys.stdout)
+    """
     fmt = fmt or config.list_format
 
     if fmt == "table":
-        return format_table(tickets, config)
+        write_table(tickets, config, out)
     elif fmt == "compact":
-        return format_compact(tickets, config)
+        write_compact(tickets, config, out)
     elif fmt == "ids":
-        return format_ids(tickets, config)
+        write_ids(tickets, config, out)
     elif fmt == "json":
-        return format_json(tickets, config)
+        write_json(tickets, config, out)
     else:
         # Default to table format
-        return format_table(tickets, config)
+        write_table(tickets, config, out)
@@ -1,16 +1,23 @@
 """Storage module for managing .bodega directory and files."""
 
+import copy
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Iterator
-import frontmatter
+from typing import TYPE_CHECKING, Callable, Optional, Iterator
 from contextlib import contextmanager
 from filelock import FileLock, Timeout
 
-from bodega.models.ticket import Ticket, TicketStatus
+from bodega.models.ticket import Ticket, TicketStatus, TicketType
 from bodega.config import BodegaConfig, load_config, write_default_config
-from bodega.utils import resolve_id, generate_id, now_utc
+from bodega.utils import resolve_id, generate_id, now_utc, parse_frontmatter
 from bodega.errors import StorageError, TicketNotFoundError, TicketExistsError
-from bodega.worktree import auto_commit_ticket
+from bodega.worktree import auto_commit_ticket, auto_commit_tickets, find_git_dir
+
+if TYPE_CHECKING:
+    from bodega.graph import DependencyGraph
 
 
 # ============================================================================
@@ -45,6 +52,94 @@ def init_repository(path: Optional[Path] = None, force: bool = False) -> Path:
     return bodega_dir
 
 
+# ============================================================================
+# Read Cache Helpers
+# ============================================================================
+
+# Cached reads are only trusted for files (and the tickets directory) last
+# modified at least this long before they were read. Filesystem timestamps
+# can be coarse, so a write landing in the same tick as a read could
+# otherwise leave the mtime unchanged and the cached copy silently stale.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# list_all() reads files on a thread pool once there are more than this
+# many tickets; below it the pool costs more than it saves.
+_PARALLEL_READ_THRESHOLD = 64
+
+
+def _copy_ticket(ticket: Ticket) -> Ticket:
+    """
+    Copy a cached ticket so callers can mutate it freely.
+
+    Args:
+        ticket: The cached ticket
+
+    Returns:
+        A copy with its own list fields
+    """
+    clone = copy.copy(ticket)
+    clone.tags = list(ticket.tags)
+    clone.deps = list(ticket.deps)
+    clone.links = list(ticket.links)
+    clone.notes = list(ticket.notes)
+    return clone
+
+
+# ============================================================================
+# Ticket File Helpers
+# ============================================================================
+
+# How often a blocked writer re-checks the lock. Writes hold it only for a
+# file rename, so a short interval keeps waiters from idling long after it
+# is released.
+_LOCK_POLL_INTERVAL = 0.005
+
+
+def _lock_path(bodega_dir: Path) -> Path:
+    """
+    Choose the shared write lock file for a bodega directory.
+
+    The lock file is never deleted, so when .bodega/ sits inside a git
+    checkout it goes in the git directory, where it can't show up in
+    git status. Outside git there is nothing to hide it from.
+
+    Args:
+        bodega_dir: The .bodega directory (or offline store)
+
+    Returns:
+        Path of the lock file
+    """
+    for parent in bodega_dir.parents:
+        git_dir = find_git_dir(parent)
+        if git_dir is not None:
+            return git_dir / "bodega.lock"
+    return bodega_dir / ".lock"
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """
+    Write a file so readers see either the old or the new contents.
+
+    The text goes to a hidden temporary file beside the target, which then
+    replaces it in one rename. A crash mid-write leaves the old ticket
+    intact instead of a truncated one. An existing file keeps its
+    permissions, and a failed write doesn't leave the temporary file behind.
+
+    Args:
+        path: File to write
+        content: Text to write (encoded as UTF-8)
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_text(content, encoding="utf-8")
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 # ============================================================================
 # Ticket Storage Class
 # ============================================================================
@@ -87,6 +182,28 @@ class TicketStorage:
             self.use_worktree = False
             self.is_offline = False
 
+        # Bumped on every write through this instance (see version())
+        self._write_count = 0
+
+        # Parsed tickets keyed by path, with the (mtime_ns, size) they were
+        # read at, and ticket IDs with the directory mtime they were listed at
+        self._ticket_cache: dict[Path, tuple[tuple[int, int], Ticket]] = {}
+        self._ids_cache: Optional[tuple[int, list[str]]] = None
+
+        # Auto-commits deferred by transaction(), or None outside one
+        self._pending_commits: Optional[list[tuple[Path, str, str, Optional[str]]]] = None
+
+        # Shared write lock (see _file_lock). The offline store lives under
+        # the home directory, which may itself be a git checkout; keep it there.
+        if self.is_offline:
+            self._lock = FileLock(self.config.bodega_dir / ".lock")
+        else:
+            self._lock = FileLock(_lock_path(self.config.bodega_dir))
+
+        # Last graph built by dependency_graph() and the version() it matches
+        self._dep_graph: Optional["DependencyGraph"] = None
+        self._dep_graph_version: Optional[tuple] = None
+
     def _ticket_path(self, ticket_id: str) -> Path:
         """
         Get the file path for a ticket ID.
@@ -117,29 +234,65 @@ class TicketStorage:
             TicketNotFoundError: If ticket doesn't exist
             AmbiguousIDError: If ID is ambiguous
         """
-        full_id = resolve_id(ticket_id, self.list_ids())
+        full_id = resolve_id(ticket_id, self._sorted_ids(), is_sorted=True)
         path = self._ticket_path(full_id)
 
-        if not path.exists():
+        try:
+            return self._read_ticket(path)
+        except FileNotFoundError:
             raise TicketNotFoundError(f"Ticket not found: {full_id}")
 
-        return self._read_ticket(path)
-
     def _read_ticket(self, path: Path) -> Ticket:
         """
         Read and parse a ticket file.
 
+        Files unchanged since they were last parsed are served from an
+        in-memory cache, validated by mtime and size.
+
         Args:
             path: Path to the ticket markdown file
 
         Returns:
             Parsed Ticket object
         """
-        post = frontmatter.load(path)
+        return self._read_ticket_if(path)
+
+    def _read_ticket_if(
+        self,
+        path: Path,
+        metadata_filter: Optional[Callable[[dict], bool]] = None,
+    ) -> Optional[Ticket]:
+        """
+        Read a ticket file, skipping the full parse if its frontmatter is rejected.
+
+        Args:
+            path: Path to the ticket markdown file
+            metadata_filter: Optional predicate on the raw frontmatter dict.
+                Only consulted on cache misses; cached tickets are returned
+                as-is for the caller to filter.
+
+        Returns:
+            Parsed Ticket object, or None if metadata_filter rejected it
+        """
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._ticket_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return _copy_ticket(cached[1])
+
+        metadata, content = parse_frontmatter(path.read_text(encoding="utf-8"))
+        if metadata_filter is not None and not metadata_filter(metadata):
+            return None
 
         # Build ticket from frontmatter + content
-        ticket_data = {**post.metadata, "content": post.content}
-        return Ticket.from_dict(ticket_data)
+        ticket_data = {**metadata, "content": content}
+        ticket = Ticket.from_dict(ticket_data)
+
+        if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            self._ticket_cache[path] = (key, _copy_ticket(ticket))
+        else:
+            self._ticket_cache.pop(path, None)
+        return ticket
 
     # ========================================================================
     # Writing Tickets
@@ -166,16 +319,11 @@ class TicketStorage:
         content = ticket.to_markdown()
 
         with self._file_lock(path):
-            path.write_text(content)
+            _write_atomic(path, content)
+        self._write_count += 1
+        self._ticket_cache.pop(path, None)
 
-        # Auto-commit to bodega branch (only in worktree mode, not offline)
-        if self.use_worktree and not self.is_offline and self.config.git_auto_commit:
-            auto_commit_ticket(
-                self.worktree_path,
-                path,
-                operation="update",
-                ticket_id=ticket.id
-            )
+        self._auto_commit(path, "update", ticket.id)
 
         return path
 
@@ -209,17 +357,12 @@ class TicketStorage:
         content = ticket.to_markdown()
 
         with self._file_lock(path):
-            path.write_text(content)
+            _write_atomic(path, content)
+        self._write_count += 1
+        self._ticket_cache.pop(path, None)
+        self._ids_cache = None
 
-        # Auto-commit with create-specific message (only in worktree mode, not offline)
-        if self.use_worktree and not self.is_offline and self.config.git_auto_commit:
-            auto_commit_ticket(
-                self.worktree_path,
-                path,
-                operation="create",
-                ticket_id=ticket.id,
-                message=ticket.title
-            )
+        self._auto_commit(path, "create", ticket.id, ticket.title)
 
         return ticket
 
@@ -236,17 +379,105 @@ class TicketStorage:
             TicketNotFoundError: If ticket doesn't exist
             AmbiguousIDError: If ID is ambiguous
         """
-        full_id = resolve_id(ticket_id, self.list_ids())
+        full_id = resolve_id(ticket_id, self._sorted_ids(), is_sorted=True)
         path = self._ticket_path(full_id)
         path.unlink()
+        self._write_count += 1
+        self._ticket_cache.pop(path, None)
+        self._ids_cache = None
+
+        self._auto_commit(path, "delete", full_id)
+
+    def _auto_commit(
+        self,
+        path: Path,
+        operation: str,
+        ticket_id: str,
+        message: Optional[str] = None
+    ) -> None:
+        """
+        Auto-commit a ticket change to the bodega branch if enabled.
+
+        Only applies in worktree mode (never offline). Inside transaction()
+        the commit is deferred until the transaction ends.
+
+        Args:
+            path: Path to the ticket file
+            operation: Operation type ('create', 'update', 'delete')
+            ticket_id: Ticket ID
+            message: Optional additional message (e.g., ticket title)
+        """
+        if not (self.use_worktree and not self.is_offline and self.config.git_auto_commit):
+            return
+
+        if self._pending_commits is not None:
+            self._pending_commits.append((path, operation, ticket_id, message))
+            return
+
+        auto_commit_ticket(
+            self.worktree_path,
+            path,
+            operation=operation,
+            ticket_id=ticket_id,
+            message=message
+        )
+
+    @contextmanager
+    def transaction(self, message: Optional[str] = None):
+        """
+        Group ticket writes in a block into a single auto-commit.
+
+        Files are still written immediately, so reads inside the block see
+        them; only the git commit waits until the block exits. If the block
+        raises, the files it already wrote are still committed, but a
+        failure of that commit never replaces the block's exception.
+        A nested transaction joins the outer one.
+
+        Args:
+            message: First line of the commit message when several tickets
+                changed (default: "Update N ticket(s)")
+
+        Yields:
+            None (context manager)
+        """
+        if self._pending_commits is not None:
+            yield
+            return
 
-        # Auto-commit deletion (only in worktree mode, not offline)
-        if self.use_worktree and not self.is_offline and self.config.git_auto_commit:
-            auto_commit_ticket(
+        pending: list[tuple[Path, str, str, Optional[str]]] = []
+        self._pending_commits = pending
+        try:
+            yield
+        except BaseException:
+            self._pending_commits = None
+            try:
+                self._commit_pending(pending, message)
+            except Exception:
+                pass
+            raise
+        self._pending_commits = None
+        self._commit_pending(pending, message)
+
+    def _commit_pending(
+        self,
+        pending: list[tuple[Path, str, str, Optional[str]]],
+        message: Optional[str]
+    ) -> None:
+        """
+        Make the auto-commit for changes collected by transaction().
+
+        Args:
+            pending: Deferred _auto_commit() arguments, in write order
+            message: First line of the commit message for several tickets
+        """
+        if len(pending) == 1:
+            self._auto_commit(*pending[0])
+        elif pending:
+            paths = list(dict.fromkeys(change[0] for change in pending))
+            auto_commit_tickets(
                 self.worktree_path,
-                path,
-                operation="delete",
-                ticket_id=full_id
+                paths,
+                message or f"Update {len(paths)} ticket(s)"
             )
 
     # ========================================================================
@@ -257,19 +488,116 @@ class TicketStorage:
         """
         Get all ticket IDs.
 
+        The listing is cached until the tickets directory changes.
+
+        Returns:
+            List of ticket IDs (without .md extension), sorted
+        """
+        return list(self._sorted_ids())
+
+    def _sorted_ids(self) -> list[str]:
+        """
+        Get the sorted ticket IDs without copying the cached list.
+
+        Callers must not modify the returned list.
+
         Returns:
-            List of ticket IDs (without .md extension)
+            Sorted list of ticket IDs
         """
-        return [p.stem for p in self.tickets_dir.glob("*.md")]
+        try:
+            mtime = self.tickets_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        cached = self._ids_cache
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # os.scandir avoids the Path object and fnmatch per entry of glob()
+        with os.scandir(self.tickets_dir) as it:
+            ids = sorted(
+                entry.name[:-3] for entry in it
+                if entry.name.endswith(".md") and entry.is_file()
+            )
+        if time.time_ns() - mtime > _RACY_WINDOW_NS:
+            self._ids_cache = (mtime, ids)
+        else:
+            self._ids_cache = None
+        return ids
 
     def list_all(self) -> list[Ticket]:
         """
         Get all tickets.
 
+        Large directories are read on a thread pool so file I/O on slow
+        or network filesystems overlaps.
+
         Returns:
             List of all Ticket objects
         """
-        return [self._read_ticket(p) for p in self.tickets_dir.glob("*.md")]
+        paths = [self._ticket_path(tid) for tid in self._sorted_ids()]
+        if len(paths) <= _PARALLEL_READ_THRESHOLD:
+            return [self._read_ticket(path) for path in paths]
+
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._read_ticket, paths))
+
+    def version(self) -> tuple:
+        """
+        Get a token that changes whenever the stored tickets change.
+
+        Combines a counter of writes made through this instance with the
+        name, mtime and size of every ticket file, so edits made by other
+        processes are picked up too. Callers compare tokens for equality
+        to decide whether derived data needs rebuilding.
+
+        Returns:
+            Opaque, hashable version token
+        """
+        entries = []
+        try:
+            with os.scandir(self.tickets_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".md"):
+                        st = entry.stat()
+                        entries.append((entry.name, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            pass
+
+        return (self._write_count, frozenset(entries))
+
+    def dependency_graph(self) -> "DependencyGraph":
+        """
+        Get a dependency graph of the current tickets.
+
+        The graph is reused until version() changes, so repeated calls in a
+        long-running process only rebuild it after tickets are written.
+
+        Returns:
+            DependencyGraph for this storage
+        """
+        # Imported here because bodega.graph imports this module
+        from bodega.graph import DependencyGraph
+
+        version = self.version()
+        if self._dep_graph is None or self._dep_graph_version != version:
+            self._dep_graph = DependencyGraph(self)
+            self._dep_graph_version = version
+        return self._dep_graph
+
+    def dependency_graph_updated(self, graph: "DependencyGraph") -> None:
+        """
+        Record that a graph was updated in place to match the latest write.
+
+        Keeps the graph from dependency_graph() reusable after a change the
+        caller has already applied to it (see DependencyGraph.add_dep).
+
+        Args:
+            graph: The graph that was updated
+        """
+        if graph is self._dep_graph:
+            self._dep_graph_version = self.version()
 
     def query(
         self,
@@ -296,29 +624,50 @@ class TicketStorage:
         Yields:
             Tickets matching the filter criteria
         """
-        for ticket in self.list_all():
+        def matches(ticket_status, type_value, tags, ticket_assignee, ticket_priority):
             # Filter by status
-            if not include_closed and ticket.status == TicketStatus.CLOSED:
-                continue
-            if status and ticket.status != status:
-                continue
+            if not include_closed and ticket_status == TicketStatus.CLOSED:
+                return False
+            if status and ticket_status != status:
+                return False
 
             # Filter by type
-            if ticket_type and ticket.type.value != ticket_type:
-                continue
+            if ticket_type and type_value != ticket_type:
+                return False
 
             # Filter by tag
-            if tag and tag not in ticket.tags:
-                continue
+            if tag and tag not in tags:
+                return False
 
             # Filter by assignee
-            if assignee and ticket.assignee != assignee:
-                continue
+            if assignee and ticket_assignee != assignee:
+                return False
 
             # Filter by priority
-            if priority is not None and ticket.priority != priority:
-                continue
+            if priority is not None and ticket_priority != priority:
+                return False
+
+            return True
+
+        def metadata_matches(metadata):
+            # Same defaults and conversions as Ticket.from_dict
+            return matches(
+                TicketStatus(metadata.get("status", "open")),
+                TicketType(metadata.get("type", "task")).value,
+                metadata.get("tags", []),
+                metadata.get("assignee"),
+                metadata.get("priority", 2),
+            )
 
+        # Filter on the frontmatter first so rejected tickets never have
+        # their markdown body parsed
+        for tid in self._sorted_ids():
+            ticket = self._read_ticket_if(self._ticket_path(tid), metadata_matches)
+            if ticket is None:
+                continue
+            if not matches(ticket.status, ticket.type.value, ticket.tags,
+                           ticket.assignee, ticket.priority):
+                continue
             yield ticket
 
     # ========================================================================
@@ -330,11 +679,14 @@ class TicketStorage:
         """
         Advisory file lock for safe concurrent writes.
 
-        Uses filelock library for cross-platform compatibility.
-        Automatically cleans up lock file after use.
+        Uses filelock library for cross-platform compatibility. All writes
+        share one lock file (see _lock_path), which is created on first use
+        and never deleted: unlinking a lock file while another process waits
+        on it would let a third process lock a fresh file at the same path,
+        and both would then think they hold the lock.
 
         Args:
-            path: Path to the file to lock
+            path: Path to the file being written
             timeout: Maximum time to wait for lock acquisition in seconds
 
         Raises:
@@ -345,16 +697,8 @@ class TicketStorage:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create lock file
-        lock_path = path.with_suffix(".lock")
-        lock = FileLock(lock_path, timeout=timeout)
-
         try:
-            with lock:
+            with self._lock.acquire(timeout=timeout, poll_interval=_LOCK_POLL_INTERVAL):
                 yield
         except Timeout:
             raise StorageError(f"Could not acquire lock on {path}")
-        finally:
-            # Cleanup: delete lock file if it exists
-            if lock_path.exists():
-                lock_path.unlink()
@@ -1,5 +1,7 @@
 """Utility functions."""
 
+import bisect
+import os
 import uuid
 import subprocess
 import re
@@ -8,6 +10,9 @@ from typing import Optional
 from datetime import datetime, UTC, timedelta
 from pathlib import Path
 
+import frontmatter
+import yaml
+
 from bodega.errors import TicketNotFoundError, AmbiguousIDError, BodegaError
 
 
@@ -50,16 +55,19 @@ def is_valid_id(id_str: str) -> bool:
     Returns:
         True if the string matches the pattern ^[a-z][a-z0-9]*-[a-z0-9\\.]+$
     """
-    return bool(id_pattern.match(id_str))
+    # fullmatch so "$" can't accept a trailing newline
+    return id_pattern.fullmatch(id_str) is not None
 
 
-def resolve_id(partial: str, all_ids: list[str]) -> str:
+def resolve_id(partial: str, all_ids: list[str], is_sorted: bool = False) -> str:
     """
     Resolve a partial ID to a full ID.
 
     Args:
         partial: Full or partial ticket ID
         all_ids: List of all known ticket IDs
+        is_sorted: True if all_ids is sorted, which lets the prefix
+            matches be found by binary search instead of a full scan
 
     Returns:
         The matching full ID
@@ -68,12 +76,24 @@ def resolve_id(partial: str, all_ids: list[str]) -> str:
         TicketNotFoundError: If no match found
         AmbiguousIDError: If multiple matches found
     """
-    # Exact match
-    if partial in all_ids:
-        return partial
+    if is_sorted:
+        # Every ID starting with partial sorts at or just after it
+        start = bisect.bisect_left(all_ids, partial)
+        end = start
+        while end < len(all_ids) and all_ids[end].startswith(partial):
+            end += 1
+        matches = all_ids[start:end]
+
+        # Exact match
+        if matches and matches[0] == partial:
+            return partial
+    else:
+        # Exact match
+        if partial in all_ids:
+            return partial
 
-    # Prefix match
-    matches = [id for id in all_ids if id.startswith(partial)]
+        # Prefix match
+        matches = [id for id in all_ids if id.startswith(partial)]
 
     if len(matches) == 1:
         return matches[0]
@@ -153,6 +173,19 @@ def format_iso(dt: datetime) -> str:
     return dt.isoformat()
 
 
+duration_pattern = re.compile(r'^(\d+)(d|days|h|hours|m|minutes)$', re.IGNORECASE)
+
+# timedelta keyword for each unit accepted by duration_pattern
+_DURATION_UNITS = {
+    'd': 'days',
+    'days': 'days',
+    'h': 'hours',
+    'hours': 'hours',
+    'm': 'minutes',
+    'minutes': 'minutes',
+}
+
+
 def parse_duration(duration_str: str) -> timedelta:
     """
     Parse a duration string into a timedelta.
@@ -171,8 +204,7 @@ def parse_duration(duration_str: str) -> timedelta:
     Raises:
         BodegaError: If the duration string is invalid
     """
-    pattern = re.compile(r'^(\d+)(d|days|h|hours|m|minutes)$', re.IGNORECASE)
-    match = pattern.match(duration_str.strip())
+    match = duration_pattern.match(duration_str.strip())
 
     if not match:
         raise BodegaError(
@@ -183,16 +215,44 @@ def parse_duration(duration_str: str) -> timedelta:
 
     value = int(match.group(1))
     unit = match.group(2).lower()
+    return timedelta(**{_DURATION_UNITS[unit]: value})
 
-    if unit in ('d', 'days'):
-        return timedelta(days=value)
-    elif unit in ('h', 'hours'):
-        return timedelta(hours=value)
-    elif unit in ('m', 'minutes'):
-        return timedelta(minutes=value)
-    else:
-        # Should never reach here due to regex, but just in case
-        raise BodegaError(f"Unsupported duration unit: {unit}")
+
+# ============================================================================
+# Frontmatter Parsing
+# ============================================================================
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_frontmatter(text: str) -> tuple[dict, str]:
+    """
+    Split a markdown file into frontmatter metadata and content.
+
+    Files in the exact layout Ticket.to_markdown() writes are split with
+    plain string searches; anything else (CR or CRLF line endings anywhere,
+    padded or longer delimiter lines) goes through frontmatter.loads.
+
+    Args:
+        text: Full ticket file contents
+
+    Returns:
+        Tuple of (metadata dict, stripped content)
+    """
+    text = text.strip()
+    if text.startswith("---\n") and "\r" not in text:
+        end = text.find("\n---\n", 3)
+        if end != -1:
+            header = text[3:end + 1]
+            # A dash-only line earlier in the header would be the real
+            # closing delimiter; leave those to frontmatter.
+            if "\n---" not in header:
+                metadata = yaml.load(header, Loader=_YAML_LOADER)
+                if isinstance(metadata, dict):
+                    return metadata, text[end + 5:].strip()
+
+    post = frontmatter.loads(text)
+    return post.metadata, post.content
 
 
 # ============================================================================
@@ -200,6 +260,13 @@ def parse_duration(duration_str: str) -> timedelta:
 # ============================================================================
 
 
+# Successful get_git_user() / find_repo_root() lookups by working directory.
+# Misses are not cached, so running `git init` or setting user.name later in
+# the same process is still picked up.
+_git_user_cache: dict[str, str] = {}
+_repo_root_cache: dict[str, str] = {}
+
+
 def get_git_user() -> Optional[str]:
     """
     Get git user.name, or None if not configured.
@@ -207,6 +274,11 @@ def get_git_user() -> Optional[str]:
     Returns:
         The git user name, or None if not configured or not in a git repo
     """
+    cwd = os.getcwd()
+    cached = _git_user_cache.get(cwd)
+    if cached is not None:
+        return cached
+
     try:
         result = subprocess.run(
             ["git", "config", "user.name"],
@@ -214,10 +286,14 @@ def get_git_user() -> Optional[str]:
             text=True,
             check=True
         )
-        return result.stdout.strip() or None
     except subprocess.CalledProcessError:
         return None
 
+    user = result.stdout.strip() or None
+    if user:
+        _git_user_cache[cwd] = user
+    return user
+
 
 def find_repo_root() -> Optional[str]:
     """
@@ -226,6 +302,11 @@ def find_repo_root() -> Optional[str]:
     Returns:
         The absolute path to the git repository root, or None if not in a git repo
     """
+    cwd = os.getcwd()
+    cached = _repo_root_cache.get(cwd)
+    if cached is not None:
+        return cached
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -233,10 +314,13 @@ def find_repo_root() -> Optional[str]:
             text=True,
             check=True
         )
-        return result.stdout.strip()
     except subprocess.CalledProcessError:
         return None
 
+    root = result.stdout.strip()
+    _repo_root_cache[cwd] = root
+    return root
+
 
 def get_git_remote_url(repo_path: Path) -> Optional[str]:
     """
@@ -392,26 +476,20 @@ def find_bodega_dir(start: Optional[Path] = None) -> Optional[Path]:
         The path to the .bodega directory (local or offline), or None if not found
     """
     start = start or Path.cwd()
-    current = start.resolve()
-    home_bodega = Path.home() / ".bodega"
+    current = os.fspath(start.resolve())
+    home_bodega = os.fspath(Path.home() / ".bodega")
 
-    # First, search up for local .bodega directory
-    while current != current.parent:
-        bodega_dir = current / ".bodega"
+    # First, search up (to the filesystem root) for local .bodega directory
+    while True:
+        bodega_dir = os.path.join(current, ".bodega")
         # Skip ~/.bodega itself - it's not a valid ticket store
         # Only ~/.bodega/<identifier>/.bodega is valid for offline mode
-        if bodega_dir.is_dir() and bodega_dir != home_bodega:
-            return bodega_dir
-        current = current.parent
-
-    # Check root
-    bodega_dir = current / ".bodega"
-    if bodega_dir.is_dir() and bodega_dir != home_bodega:
-        return bodega_dir
+        if bodega_dir != home_bodega and os.path.isdir(bodega_dir):
+            return Path(bodega_dir)
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
 
     # If no local .bodega found, check for offline store
-    offline_store = find_offline_store(start)
-    if offline_store:
-        return offline_store
-
-    return None
+    return find_offline_store(start)
@@ -1,14 +1,14 @@
 """Git worktree management for bodega ticket storage."""
 
-import frontmatter
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 import shutil
 
 from bodega.errors import StorageError
-from bodega.utils import find_repo_root
+from bodega.utils import find_repo_root, parse_frontmatter
 
 
 @dataclass
@@ -47,6 +47,15 @@ class PushResult:
     had_conflicts: bool
 
 
+# Subcommands that only read the repository. They run with
+# --no-optional-locks so that e.g. `git status` doesn't refresh (and lock)
+# the index, which could collide with a concurrent commit or the user's own
+# git commands.
+_READ_ONLY_COMMANDS = frozenset({
+    'status', 'diff', 'rev-list', 'rev-parse', 'ls-remote', 'for-each-ref', 'show',
+})
+
+
 def _run_git(cmd: list[str], cwd: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
     """
     Run a git command.
@@ -62,6 +71,9 @@ def _run_git(cmd: list[str], cwd: Optional[Path] = None, check: bool = True) ->
     Raises:
         StorageError: If command fails and check=True
     """
+    if len(cmd) > 1 and cmd[1] in _READ_ONLY_COMMANDS:
+        cmd = [cmd[0], '--no-optional-locks', *cmd[1:]]
+
     try:
         result = subprocess.run(
             cmd,
@@ -75,6 +87,54 @@ def _run_git(cmd: list[str], cwd: Optional[Path] = None, check: bool = True) ->
         raise StorageError(f"Git command failed: {' '.join(cmd)}\n{e.stderr}")
 
 
+def _cat_file_batch(cwd: Path, objects: list[str]) -> Optional[list[Optional[str]]]:
+    """
+    Read several git objects with a single ``git cat-file --batch``.
+
+    Args:
+        cwd: Working directory for command
+        objects: Object names (e.g., ['HEAD:path', ':path'])
+
+    Returns:
+        Decoded contents in the same order, None for missing objects; or
+        None if the batch couldn't be run at all
+    """
+    # Names are sent one per line, so a newline would desynchronize them
+    if any('\n' in name for name in objects):
+        return None
+    if not objects:
+        return []
+
+    result = subprocess.run(
+        ['git', 'cat-file', '--batch=%(objectsize)'],
+        cwd=cwd,
+        input=''.join(f'{name}\n' for name in objects).encode('utf-8'),
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        return None
+
+    # Each object is "<size>\n<content>\n"; anything else on the header line
+    # ("<name> missing", "<name> ambiguous") means there's no content
+    out = result.stdout
+    contents: list[Optional[str]] = []
+    pos = 0
+    try:
+        for _ in objects:
+            eol = out.index(b'\n', pos)
+            header = out[pos:eol]
+            pos = eol + 1
+            if not header.isdigit():
+                contents.append(None)
+                continue
+            size = int(header)
+            contents.append(out[pos:pos + size].decode('utf-8', errors='replace'))
+            pos += size + 1
+    except ValueError:
+        return None
+    return contents
+
+
 def _generate_batch_commit_message(worktree_path: Path, prefix: str) -> str:
     """
     Generate a descriptive commit message for batched changes.
@@ -97,7 +157,7 @@ def _generate_batch_commit_message(worktree_path: Path, prefix: str) -> str:
     """
     # Get list of changed files
     result = _run_git(
-        ['git', 'diff', '--cached', '--name-only', '.bodega/'],
+        ['git', 'diff', '--cached', '--name-only', '-z', '.bodega/'],
         cwd=worktree_path,
         check=False
     )
@@ -106,35 +166,60 @@ def _generate_batch_commit_message(worktree_path: Path, prefix: str) -> str:
         # No staged changes, return simple message
         return prefix
 
-    changed_files = [f.strip() for f in result.stdout.strip().split('\n') if f.strip()]
+    # NUL-separated so unusual filenames come back unquoted
+    changed_files = [f for f in result.stdout.split('\0') if f]
 
     if not changed_files:
         return prefix
 
     # Separate ticket files from other files
-    ticket_files = []
+    ticket_paths = []
     other_files = []
-
     for file_path in changed_files:
         if file_path.endswith('.md') and '.bodega/' in file_path:
-            # It's a ticket file - try to read it for title and detect state change
-            full_path = worktree_path / file_path
-            if full_path.exists():
-                try:
-                    post = frontmatter.load(full_path)
-                    ticket_id = post.metadata.get('id', full_path.stem)
-                    ticket_title = post.metadata.get('title', 'Unknown title')
-                    change_type = _detect_ticket_state_change(worktree_path, file_path, post.metadata)
-                    ticket_files.append((ticket_id, ticket_title, change_type))
-                except Exception:
-                    # If we can't read it, just use the filename
-                    ticket_files.append((full_path.stem, '(unable to read title)', 'updated'))
-            else:
-                # File was deleted - just use the filename
-                ticket_files.append((full_path.stem, '(deleted)', 'updated'))
+            ticket_paths.append(file_path)
         else:
             other_files.append(file_path)
 
+    # Fetch the staged and previous version of every ticket in one git call
+    objects = []
+    for file_path in ticket_paths:
+        objects.extend([f':{file_path}', f'HEAD:{file_path}'])
+    contents = _cat_file_batch(worktree_path, objects)
+
+    ticket_files = []
+    for i, file_path in enumerate(ticket_paths):
+        stem = Path(file_path).stem
+        if contents is not None:
+            new_text = contents[2 * i]
+        else:
+            # Batch failed - fall back to the working tree copy, which
+            # `git add` just staged
+            full_path = worktree_path / file_path
+            try:
+                new_text = full_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                new_text = None
+            except OSError:
+                ticket_files.append((stem, '(unable to read title)', 'updated'))
+                continue
+        if new_text is None:
+            # File was deleted - just use the filename
+            ticket_files.append((stem, '(deleted)', 'updated'))
+            continue
+        try:
+            metadata, _ = parse_frontmatter(new_text)
+            ticket_id = metadata.get('id', stem)
+            ticket_title = metadata.get('title', 'Unknown title')
+            if contents is not None:
+                change_type = _classify_state_change(contents[2 * i + 1], metadata)
+            else:
+                change_type = _detect_ticket_state_change(worktree_path, file_path, metadata)
+            ticket_files.append((ticket_id, ticket_title, change_type))
+        except Exception:
+            # If we can't read it, just use the filename
+            ticket_files.append((stem, '(unable to read title)', 'updated'))
+
     # Build commit message
     lines = [prefix]
 
@@ -175,15 +260,28 @@ def _detect_ticket_state_change(worktree_path: Path, file_path: str, new_metadat
         cwd=worktree_path,
         check=False
     )
+    old_text = result.stdout if result.returncode == 0 else None
+    return _classify_state_change(old_text, new_metadata)
 
-    if result.returncode != 0:
+
+def _classify_state_change(old_text: Optional[str], new_metadata: dict) -> str:
+    """
+    Classify a ticket state change given its previous file contents.
+
+    Args:
+        old_text: Previous ticket file contents, or None if it didn't exist
+        new_metadata: New ticket metadata (frontmatter)
+
+    Returns:
+        State change: "created", "closed", "reopened", "updated", or ""
+    """
+    if old_text is None:
         # File didn't exist before (new ticket)
         return "created"
 
     # Parse the old version
     try:
-        old_post = frontmatter.loads(result.stdout)
-        old_metadata = old_post.metadata
+        old_metadata, _ = parse_frontmatter(old_text)
     except Exception:
         # Could not parse old version
         return ""
@@ -202,10 +300,51 @@ def _detect_ticket_state_change(worktree_path: Path, file_path: str, new_metadat
     return ""
 
 
+def find_git_dir(repo_root: Path) -> Optional[Path]:
+    """
+    Locate the git directory of a repository or linked worktree.
+
+    Args:
+        repo_root: Path to git repository root (or worktree root)
+
+    Returns:
+        Path to the git directory, or None if repo_root has no .git entry
+    """
+    git_path = repo_root / ".git"
+    if git_path.is_dir():
+        return git_path
+
+    # Linked worktrees and submodules have a .git file pointing elsewhere
+    try:
+        content = git_path.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir: "):
+        return None
+    return repo_root / content[len("gitdir: "):]
+
+
+def _find_head_file(repo_root: Path) -> Optional[Path]:
+    """
+    Locate the HEAD file for a repository or linked worktree.
+
+    Args:
+        repo_root: Path to git repository root (or worktree root)
+
+    Returns:
+        Path to HEAD, or None if the layout isn't recognized
+    """
+    git_dir = find_git_dir(repo_root)
+    return git_dir / "HEAD" if git_dir is not None else None
+
+
 def get_current_branch(repo_root: Path) -> str:
     """
     Get the current git branch name.
 
+    The branch is read straight from the HEAD file when possible, which
+    avoids spawning git.
+
     Args:
         repo_root: Path to git repository root
 
@@ -215,6 +354,21 @@ def get_current_branch(repo_root: Path) -> str:
     Raises:
         StorageError: If not on a branch or git command fails
     """
+    head_file = _find_head_file(repo_root)
+    head = None
+    if head_file is not None:
+        try:
+            head = head_file.read_text().strip()
+        except OSError:
+            pass
+
+    if head is not None and head.startswith("ref: refs/heads/"):
+        branch = head[len("ref: refs/heads/"):]
+        if branch != ".invalid":
+            return branch
+
+    # Anything unusual (reftable's placeholder HEAD, unreadable layout) goes
+    # through git, which also handles a detached HEAD
     result = _run_git(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], cwd=repo_root)
     branch = result.stdout.strip()
     if branch == 'HEAD':
@@ -250,13 +404,17 @@ def init_worktree(repo_root: Path, bodega_dir: Path, branch_name: str = "bodega"
     gitignore_path = bodega_dir / ".gitignore"
     gitignore_path.write_text("worktree/\n*.lock\n")
 
-    # Check if branch already exists locally
-    result = _run_git(['git', 'rev-parse', '--verify', branch_name], cwd=repo_root, check=False)
-    branch_exists_locally = result.returncode == 0
-
-    # Check if branch exists on remote
-    result = _run_git(['git', 'rev-parse', '--verify', f'origin/{branch_name}'], cwd=repo_root, check=False)
-    branch_exists_remotely = result.returncode == 0
+    # Check if branch already exists locally and/or on remote, in one call
+    local_ref = f'refs/heads/{branch_name}'
+    remote_ref = f'refs/remotes/origin/{branch_name}'
+    result = _run_git(
+        ['git', 'for-each-ref', '--format=%(refname)', local_ref, remote_ref],
+        cwd=repo_root,
+        check=False
+    )
+    refs = set(result.stdout.splitlines())
+    branch_exists_locally = local_ref in refs
+    branch_exists_remotely = remote_ref in refs
 
     if branch_exists_locally:
         # Branch exists locally, just create worktree
@@ -397,6 +555,52 @@ def auto_commit_ticket(
     return result.stdout.strip()
 
 
+def auto_commit_tickets(
+    worktree_path: Path,
+    ticket_files: list[Path],
+    prefix: str
+) -> Optional[str]:
+    """
+    Auto-commit several ticket changes to bodega branch in one commit.
+
+    Args:
+        worktree_path: Path to worktree root (.bodega/worktree/)
+        ticket_files: Paths to created, updated or deleted ticket files
+        prefix: First line of the commit message; ticket details follow
+
+    Returns:
+        Commit SHA, or None if commit failed
+
+    Raises:
+        StorageError: If git commands fail
+    """
+    # Stage writes with add and deletions with rm; --ignore-unmatch covers a
+    # ticket that was created and deleted again before committing
+    added = [str(f.relative_to(worktree_path)) for f in ticket_files if f.exists()]
+    removed = [str(f.relative_to(worktree_path)) for f in ticket_files if not f.exists()]
+    if added:
+        _run_git(['git', 'add', '--', *added], cwd=worktree_path)
+    if removed:
+        _run_git(
+            ['git', 'rm', '--cached', '--quiet', '--ignore-unmatch', '--', *removed],
+            cwd=worktree_path
+        )
+
+    commit_msg = _generate_batch_commit_message(worktree_path, prefix)
+    result = _run_git(
+        ['git', 'commit', '-m', commit_msg],
+        cwd=worktree_path,
+        check=False
+    )
+
+    if result.returncode != 0:
+        # Commit failed (possibly nothing to commit)
+        return None
+
+    result = _run_git(['git', 'rev-parse', 'HEAD'], cwd=worktree_path)
+    return result.stdout.strip()
+
+
 def has_uncommitted_changes(path: Path, subdir: Optional[str] = None) -> bool:
     """
     Check if there are uncommitted changes in a directory.
@@ -438,6 +642,33 @@ def get_commits_ahead(repo_root: Path, branch1: str, branch2: str) -> int:
     return int(result.stdout.strip())
 
 
+def get_ahead_behind(repo_root: Path, branch1: str, branch2: str) -> tuple[int, int]:
+    """
+    Get how many commits each of two branches has that the other lacks.
+
+    Equivalent to calling get_commits_ahead() both ways, with one git
+    process instead of two.
+
+    Args:
+        repo_root: Path to git repository root
+        branch1: First branch name
+        branch2: Second branch name
+
+    Returns:
+        Tuple of (commits branch1 is ahead of branch2,
+        commits branch2 is ahead of branch1)
+    """
+    result = _run_git(
+        ['git', 'rev-list', '--left-right', '--count', f'{branch1}...{branch2}'],
+        cwd=repo_root,
+        check=False
+    )
+    if result.returncode != 0:
+        return 0, 0
+    ahead, behind = result.stdout.split()
+    return int(ahead), int(behind)
+
+
 def get_sync_status(
     repo_root: Path,
     worktree_path: Path,
@@ -456,10 +687,14 @@ def get_sync_status(
     Returns:
         SyncStatus with sync information
     """
-    commits_ahead_main = get_commits_ahead(repo_root, main_branch, bodega_branch)
-    commits_ahead_bodega = get_commits_ahead(repo_root, bodega_branch, main_branch)
-    uncommitted_in_main = has_uncommitted_changes(repo_root, '.bodega')
-    uncommitted_in_worktree = has_uncommitted_changes(worktree_path, '.bodega')
+    # The probes are independent, so run the git processes concurrently
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        ahead_behind = pool.submit(get_ahead_behind, repo_root, main_branch, bodega_branch)
+        main_dirty = pool.submit(has_uncommitted_changes, repo_root, '.bodega')
+        worktree_dirty = pool.submit(has_uncommitted_changes, worktree_path, '.bodega')
+        commits_ahead_main, commits_ahead_bodega = ahead_behind.result()
+        uncommitted_in_main = main_dirty.result()
+        uncommitted_in_worktree = worktree_dirty.result()
 
     return SyncStatus(
         commits_ahead_main=commits_ahead_main,
@@ -516,8 +751,9 @@ def sync_branches(
         )
 
     # Get initial commit counts
-    initial_commits_main = get_commits_ahead(repo_root, main_branch, bodega_branch)
-    initial_commits_bodega = get_commits_ahead(repo_root, bodega_branch, main_branch)
+    initial_commits_main, initial_commits_bodega = get_ahead_behind(
+        repo_root, main_branch, bodega_branch
+    )
 
     had_conflicts = False
 
@@ -581,11 +817,11 @@ def sync_branches(
 
     # Count changed files in .bodega/
     result = _run_git(
-        ['git', 'diff', '--name-only', 'HEAD', '.bodega/'],
+        ['git', 'diff', '--name-only', '-z', 'HEAD', '.bodega/'],
         cwd=repo_root,
         check=False
     )
-    files_changed = len([line for line in result.stdout.strip().split('\n') if line])
+    files_changed = result.stdout.count('\0')
 
     return SyncResult(
         commits_from_main=commits_from_main,
@@ -633,33 +869,30 @@ def get_push_status(
     Returns:
         PushStatus with push information
     """
-    # Check if remote branch exists
-    result = _run_git(
-        ['git', 'ls-remote', '--heads', 'origin', bodega_branch],
-        cwd=worktree_path,
-        check=False
-    )
-    has_remote = bool(result.stdout.strip())
-
-    commits_to_push = 0
-    commits_to_pull = 0
-
-    if has_remote:
-        # Fetch latest remote state
-        _run_git(['git', 'fetch', 'origin', bodega_branch], cwd=worktree_path, check=False)
-
-        # Get commits ahead (to push)
-        commits_to_push = get_commits_ahead(worktree_path, bodega_branch, f'origin/{bodega_branch}')
-
-        # Get commits behind (to pull)
-        commits_to_pull = get_commits_ahead(worktree_path, f'origin/{bodega_branch}', bodega_branch)
-    else:
-        # No remote - count all commits
-        result = _run_git(['git', 'rev-list', '--count', 'HEAD'], cwd=worktree_path, check=False)
-        if result.returncode == 0:
-            commits_to_push = int(result.stdout.strip())
+    # The local status check doesn't depend on the remote, so run it while
+    # talking to origin
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worktree_dirty = pool.submit(has_uncommitted_changes, worktree_path, '.bodega')
+
+        # Fetch latest remote state (fails if the remote branch doesn't exist)
+        result = _run_git(['git', 'fetch', 'origin', bodega_branch], cwd=worktree_path, check=False)
+        has_remote = result.returncode == 0
+
+        commits_to_push = 0
+        commits_to_pull = 0
+
+        if has_remote:
+            # Get commits ahead (to push) and behind (to pull)
+            commits_to_push, commits_to_pull = get_ahead_behind(
+                worktree_path, bodega_branch, f'origin/{bodega_branch}'
+            )
+        else:
+            # No remote - count all commits
+            result = _run_git(['git', 'rev-list', '--count', 'HEAD'], cwd=worktree_path, check=False)
+            if result.returncode == 0:
+                commits_to_push = int(result.stdout.strip())
 
-    uncommitted_changes = has_uncommitted_changes(worktree_path, '.bodega')
+        uncommitted_changes = worktree_dirty.result()
 
     return PushStatus(
         has_remote=has_remote,
@@ -681,7 +914,7 @@ def push_to_remote(
     1. Auto-commits any uncommitted changes
     2. Fetches from remote
     3. Rebases local changes on remote (or merges if rebase fails)
-    4. Pushes to remote
+    4. Pushes to remote, setting it as upstream
 
     Args:
         repo_root: Path to git repository root
@@ -711,20 +944,15 @@ def push_to_remote(
         )
         auto_committed = result.returncode == 0
 
-    # Step 2: Fetch from remote
-    _run_git(['git', 'fetch', 'origin', bodega_branch], cwd=worktree_path, check=False)
-
-    # Step 3: Check if remote exists
-    result = _run_git(
-        ['git', 'ls-remote', '--heads', 'origin', bodega_branch],
-        cwd=worktree_path,
-        check=False
-    )
-    has_remote = bool(result.stdout.strip())
+    # Step 2: Fetch from remote (fails if the remote branch doesn't exist yet)
+    result = _run_git(['git', 'fetch', 'origin', bodega_branch], cwd=worktree_path, check=False)
+    has_remote = result.returncode == 0
 
-    # Count commits to push BEFORE we sync/push
+    # Count commits to push (and to pull) BEFORE we sync/push
     if has_remote:
-        pushed_commits = get_commits_ahead(worktree_path, bodega_branch, f'origin/{bodega_branch}')
+        pushed_commits, pulled_commits = get_ahead_behind(
+            worktree_path, bodega_branch, f'origin/{bodega_branch}'
+        )
     else:
         # No remote yet - count all commits
         result = _run_git(['git', 'rev-list', '--count', 'HEAD'], cwd=worktree_path, check=False)
@@ -732,9 +960,6 @@ def push_to_remote(
             pushed_commits = int(result.stdout.strip())
 
     if has_remote:
-        # Get initial commit count to pull
-        pulled_commits = get_commits_ahead(worktree_path, f'origin/{bodega_branch}', bodega_branch)
-
         if pulled_commits > 0:
             # Try rebase first
             merge_strategy = []
@@ -768,27 +993,12 @@ def push_to_remote(
                         )
                     had_conflicts = True
 
-    # Step 4: Set upstream if not set
+    # Step 3: Push to remote, (re)setting upstream so later plain pushes work
     result = _run_git(
-        ['git', 'rev-parse', '--abbrev-ref', '--symbolic-full-name', '@{u}'],
+        ['git', 'push', '-u', 'origin', bodega_branch],
         cwd=worktree_path,
         check=False
     )
-    if result.returncode != 0 or not result.stdout.strip():
-        # No upstream set, set it
-        _run_git(
-            ['git', 'branch', '--set-upstream-to', f'origin/{bodega_branch}', bodega_branch],
-            cwd=worktree_path,
-            check=False
-        )
-
-    # Step 5: Push to remote
-    push_cmd = ['git', 'push']
-    if not has_remote:
-        # First push - set upstream
-        push_cmd.extend(['-u', 'origin', bodega_branch])
-
-    result = _run_git(push_cmd, cwd=worktree_path, check=False)
 
     if result.returncode != 0:
         raise StorageError(f"Failed to push to remote:\n{result.stderr}")
@@ -9,12 +9,21 @@ from bodega.config import BodegaConfig
 from bodega.storage import TicketStorage, init_repository
 from bodega.models import Ticket, TicketType, TicketStatus
 from bodega.cli import main
+from bodega.output import reset_color_cache
 
 
 # ============================================================================
 # Basic Fixtures
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def fresh_color_cache():
+    """Re-check color support in every test, since tests patch stdout/NO_COLOR."""
+    reset_color_cache()
+    yield
+    reset_color_cache()
+
+
 @pytest.fixture
 def runner():
     """Click CLI test runner."""
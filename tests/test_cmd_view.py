@@ -277,6 +277,21 @@ def test_edit_updates_title(runner, temp_repo_with_ticket):
     assert data["title"] == "Updated title"
 
 
+def test_edit_no_op_does_not_save(runner, temp_repo_with_ticket):
+    """Test that edit with unchanged values reports no changes."""
+    ticket_id = temp_repo_with_ticket
+
+    result = runner.invoke(main, ["show", "--json", ticket_id])
+    before = json.loads(result.output)
+
+    result = runner.invoke(main, ["edit", ticket_id, "--title", before["title"]])
+    assert result.exit_code == 0
+    assert "No changes made" in result.output
+
+    result = runner.invoke(main, ["show", "--json", ticket_id])
+    assert json.loads(result.output)["updated"] == before["updated"]
+
+
 def test_edit_updates_type(runner, temp_repo_with_ticket):
     """Test that edit --type updates ticket type."""
     ticket_id = temp_repo_with_ticket
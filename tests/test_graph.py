@@ -4,6 +4,7 @@ import pytest
 
 from bodega.graph import DependencyGraph
 from bodega.models.ticket import Ticket, TicketStatus
+from bodega.operations import add_dependency
 
 
 # ============================================================================
@@ -224,6 +225,44 @@ def test_find_cycles_three_node_cycle(storage):
     )
 
 
+def test_find_cycles_reports_each_component_once(storage):
+    """Test that separate cycles are each reported exactly once."""
+    storage.save(Ticket(id="bg-aaa", title="A", deps=["bg-bbb"]))
+    storage.save(Ticket(id="bg-bbb", title="B", deps=["bg-aaa", "bg-ccc"]))
+    storage.save(Ticket(id="bg-ccc", title="C", deps=["bg-ddd"]))
+    storage.save(Ticket(id="bg-ddd", title="D", deps=["bg-ccc"]))
+    storage.save(Ticket(id="bg-eee", title="E", deps=["bg-eee"]))
+
+    graph = DependencyGraph(storage)
+    cycles = graph.find_cycles()
+
+    members = sorted(sorted(set(cycle)) for cycle in cycles)
+    assert members == [
+        ["bg-aaa", "bg-bbb"],
+        ["bg-ccc", "bg-ddd"],
+        ["bg-eee"],
+    ]
+    assert all(cycle[0] == cycle[-1] for cycle in cycles)
+
+
+def test_find_cycles_follows_real_edges(storage):
+    """Test that reported cycles of a non-ring component are real paths."""
+    # A <-> B <-> C: one component, but C does not depend on A
+    storage.save(Ticket(id="bg-aaa", title="A", deps=["bg-bbb"]))
+    storage.save(Ticket(id="bg-bbb", title="B", deps=["bg-aaa", "bg-ccc"]))
+    storage.save(Ticket(id="bg-ccc", title="C", deps=["bg-bbb"]))
+    storage.save(Ticket(id="bg-ddd", title="D", deps=["bg-ddd"]))
+
+    graph = DependencyGraph(storage)
+    cycles = graph.find_cycles()
+
+    assert len(cycles) == 2
+    for cycle in cycles:
+        assert cycle[0] == cycle[-1]
+        for ticket_id, dep_id in zip(cycle, cycle[1:]):
+            assert dep_id in storage.get(ticket_id).deps
+
+
 def test_has_cycle_true(storage):
     """Test has_cycle returns True when cycle exists."""
     storage.save(Ticket(id="bg-aaa", title="A", deps=["bg-bbb"]))
@@ -239,6 +278,16 @@ def test_has_cycle_false(graph_with_simple_deps):
     assert graph_with_simple_deps.has_cycle() is False
 
 
+def test_has_cycle_self_dependency(storage):
+    """Test has_cycle detects a ticket that depends on itself."""
+    storage.save(Ticket(id="bg-aaa", title="A", deps=["bg-aaa"]))
+    storage.save(Ticket(id="bg-bbb", title="B", deps=["bg-nonexistent"]))
+
+    graph = DependencyGraph(storage)
+
+    assert graph.has_cycle() is True
+
+
 def test_find_cycles_handles_missing_tickets(storage):
     """Test that cycle detection handles missing ticket references."""
     storage.save(Ticket(id="bg-aaa", title="A", deps=["bg-nonexistent"]))
@@ -250,6 +299,20 @@ def test_find_cycles_handles_missing_tickets(storage):
     assert len(cycles) == 0
 
 
+def test_find_cycles_deep_chain(storage):
+    """Test that cycle detection handles chains deeper than the recursion limit."""
+    depth = 1500
+    for i in range(depth):
+        deps = [f"bg-{i + 1:04d}"] if i + 1 < depth else ["bg-0000"]
+        storage.save(Ticket(id=f"bg-{i:04d}", title=f"Task {i}", deps=deps))
+
+    graph = DependencyGraph(storage)
+    cycles = graph.find_cycles()
+
+    assert len(cycles) == 1
+    assert len(cycles[0]) == depth + 1
+
+
 # ============================================================================
 # Tree Visualization Tests
 # ============================================================================
@@ -332,6 +395,35 @@ def test_format_tree_cycle_detection(storage):
     assert "(cycle)" in tree
 
 
+def test_format_tree_shared_descendant_not_cycle(storage):
+    """Test that a ticket reached along two paths is not reported as a cycle."""
+    storage.save(Ticket(id="bg-root", title="Root"))
+    storage.save(Ticket(id="bg-left", title="Left", deps=["bg-root"]))
+    storage.save(Ticket(id="bg-right", title="Right", deps=["bg-root"]))
+    storage.save(Ticket(id="bg-join", title="Join", deps=["bg-left", "bg-right"]))
+
+    graph = DependencyGraph(storage)
+    tree = graph.format_tree("bg-root")
+
+    assert "(cycle)" not in tree
+    assert tree.count("bg-join [open] Join") == 2
+
+
+def test_format_tree_deep_chain(storage):
+    """Test formatting a chain deeper than the recursion limit."""
+    depth = 1500
+    storage.save(Ticket(id="bg-0000", title="Task 0"))
+    for i in range(1, depth):
+        storage.save(Ticket(id=f"bg-{i:04d}", title=f"Task {i}", deps=[f"bg-{i - 1:04d}"]))
+
+    graph = DependencyGraph(storage)
+    tree = graph.format_tree("bg-0000")
+
+    lines = tree.split("\n")
+    assert len(lines) == depth
+    assert lines[-1].endswith(f"bg-{depth - 1:04d} [open] Task {depth - 1}")
+
+
 def test_format_tree_all_roots(storage):
     """Test formatting all root tickets."""
     storage.save(Ticket(id="bg-root1", title="Root 1"))
@@ -452,6 +544,74 @@ def test_get_all_blockers_handles_cycles(storage):
     assert "bg-aaa" in blockers
 
 
+def test_get_all_blockers_shared_ancestors(storage):
+    """Test transitive blockers across shared ancestors and a downstream cycle."""
+    # D blocks B and C, both block A; E and F form a cycle that G depends on
+    storage.save(Ticket(id="bg-aaa", title="A", deps=["bg-bbb", "bg-ccc"]))
+    storage.save(Ticket(id="bg-bbb", title="B", deps=["bg-ddd"]))
+    storage.save(Ticket(id="bg-ccc", title="C", deps=["bg-ddd"]))
+    storage.save(Ticket(id="bg-ddd", title="D"))
+    storage.save(Ticket(id="bg-eee", title="E", deps=["bg-fff"]))
+    storage.save(Ticket(id="bg-fff", title="F", deps=["bg-eee"]))
+    storage.save(Ticket(id="bg-ggg", title="G", deps=["bg-eee", "bg-ddd"]))
+
+    graph = DependencyGraph(storage)
+
+    assert sorted(graph.get_all_blockers("bg-aaa")) == ["bg-bbb", "bg-ccc", "bg-ddd"]
+    assert sorted(graph.get_all_blockers("bg-bbb")) == ["bg-ddd"]
+    assert graph.get_all_blockers("bg-ddd") == []
+    assert sorted(graph.get_all_blockers("bg-ggg")) == ["bg-ddd", "bg-eee", "bg-fff"]
+    assert sorted(graph.get_all_blockers("bg-eee")) == ["bg-eee", "bg-fff"]
+
+
+def test_add_dep_matches_rebuild(storage):
+    """Test that add_dep leaves the graph as a fresh build would."""
+    storage.save(Ticket(id="bg-aaa", title="A"))
+    storage.save(Ticket(id="bg-bbb", title="B", deps=["bg-ccc"]))
+    storage.save(Ticket(id="bg-ccc", title="C"))
+    storage.save(Ticket(id="bg-ddd", title="D", status=TicketStatus.CLOSED))
+
+    graph = DependencyGraph(storage)
+    assert graph.get_all_blockers("bg-aaa") == []
+
+    graph.add_dep("bg-aaa", "bg-bbb")
+    graph.add_dep("bg-ccc", "bg-ddd")
+
+    ticket = storage.get("bg-aaa")
+    ticket.deps.append("bg-bbb")
+    storage.save(ticket)
+    ticket = storage.get("bg-ccc")
+    ticket.deps.append("bg-ddd")
+    storage.save(ticket)
+    fresh = DependencyGraph(storage)
+
+    for tid in ["bg-aaa", "bg-bbb", "bg-ccc", "bg-ddd"]:
+        assert graph.is_blocked(tid) == fresh.is_blocked(tid)
+        assert graph.get_blockers(tid) == fresh.get_blockers(tid)
+        assert sorted(graph.get_all_blockers(tid)) == sorted(fresh.get_all_blockers(tid))
+    assert sorted(graph.get_all_blockers("bg-aaa")) == ["bg-bbb", "bg-ccc", "bg-ddd"]
+    assert graph.format_tree() == fresh.format_tree()
+    assert [t.id for t in graph.get_ready_tickets()] == [
+        t.id for t in fresh.get_ready_tickets()
+    ]
+
+
+def test_storage_dependency_graph_reused_until_write(storage):
+    """Test that storage.dependency_graph() is rebuilt only after writes."""
+    storage.save(Ticket(id="bg-aaa", title="A"))
+    storage.save(Ticket(id="bg-bbb", title="B"))
+
+    graph = storage.dependency_graph()
+    assert storage.dependency_graph() is graph
+
+    add_dependency(storage, "bg-aaa", "bg-bbb", graph)
+    assert storage.dependency_graph() is graph
+    assert graph.is_blocked("bg-aaa") is True
+
+    storage.save(Ticket(id="bg-ccc", title="C"))
+    assert storage.dependency_graph() is not graph
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -1,11 +1,13 @@
 """Tests for output formatting module."""
 
 import pytest
+import io
 import json
 
 from bodega.output import (
     Colors,
     colorize,
+    reset_color_cache,
     status_color,
     priority_color,
     type_color,
@@ -16,6 +18,7 @@ from bodega.output import (
     format_ticket_detail,
     format_tickets,
     ticket_to_dict,
+    write_tickets,
 )
 from bodega.models.ticket import Ticket, TicketStatus, TicketType
 from bodega.config import BodegaConfig
@@ -94,6 +97,19 @@ def test_colors_disabled_without_tty(monkeypatch):
     assert not Colors.enabled()
 
 
+def test_colors_enabled_is_cached(monkeypatch):
+    """Test that color support is checked once until the cache is reset."""
+    monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    assert Colors.enabled()
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert Colors.enabled()
+
+    reset_color_cache()
+    assert not Colors.enabled()
+
+
 def test_colorize_with_colors_enabled(monkeypatch):
     """Test colorize when colors are enabled."""
     monkeypatch.setattr("sys.stdout.isatty", lambda: True)
@@ -287,6 +303,14 @@ def test_format_json_not_pretty(sample_tickets, config):
     assert len(data) == 3
 
 
+def test_format_json_matches_json_dumps(sample_tickets, config):
+    """Test that per-ticket encoding matches json.dumps of the whole list."""
+    for tickets in (sample_tickets, []):
+        data = [ticket_to_dict(t) for t in tickets]
+        assert format_json(tickets, config) == json.dumps(data, indent=2, default=str)
+        assert format_json(tickets, config, pretty=False) == json.dumps(data, default=str)
+
+
 def test_ticket_to_dict_complete():
     """Test ticket_to_dict with all fields populated."""
     now = now_utc()
@@ -446,6 +470,15 @@ def test_format_tickets_json(sample_tickets, config):
     assert len(data) == 3
 
 
+@pytest.mark.parametrize("fmt", ["table", "compact", "ids", "json"])
+def test_write_tickets_matches_format_tickets(sample_tickets, config, fmt):
+    """Test that streaming output is format_tickets() plus a newline."""
+    for tickets in (sample_tickets, []):
+        out = io.StringIO()
+        write_tickets(tickets, config, fmt, out)
+        assert out.getvalue() == format_tickets(tickets, config, fmt) + "\n"
+
+
 def test_format_tickets_default_from_config(sample_tickets, monkeypatch):
     """Test that format_tickets uses config.list_format by default."""
     monkeypatch.setenv("NO_COLOR", "1")
@@ -1,6 +1,8 @@
 """Tests for storage module."""
 
 import pytest
+import os
+import subprocess
 import threading
 import time
 
@@ -293,6 +295,64 @@ def test_get_ambiguous_id(storage_with_tickets):
             storage.get("bg")
 
 
+def _age(path, seconds=60):
+    """Backdate a file's mtime so storage treats cached reads of it as safe."""
+    stamp = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_get_cached_ticket_is_independent_copy(storage_with_tickets):
+    """Test that mutating a returned ticket doesn't affect later reads."""
+    storage, _ = storage_with_tickets
+    _age(storage._ticket_path("bg-aaa111"))
+
+    first = storage.get("bg-aaa111")
+    first.tags.append("mutated")
+    first.title = "Mutated"
+
+    second = storage.get("bg-aaa111")
+    assert second.title == "Bug fix"
+    assert "mutated" not in second.tags
+
+
+def test_get_sees_external_edits(storage_with_tickets):
+    """Test that a file changed outside storage is re-read."""
+    storage, _ = storage_with_tickets
+    path = storage._ticket_path("bg-aaa111")
+    _age(path, 120)
+    assert storage.get("bg-aaa111").title == "Bug fix"
+
+    path.write_text(path.read_text().replace("Bug fix", "Edited elsewhere"))
+    _age(path, 60)
+
+    assert storage.get("bg-aaa111").title == "Edited elsewhere"
+
+
+def test_get_reads_crlf_ticket(storage_with_tickets):
+    """Test that tickets saved with CRLF line endings still parse."""
+    storage, _ = storage_with_tickets
+    path = storage._ticket_path("bg-aaa111")
+    expected = storage.get("bg-aaa111")
+    path.write_bytes(path.read_bytes().replace(b"\n", b"\r\n"))
+
+    ticket = storage.get("bg-aaa111")
+    assert ticket.title == expected.title
+    assert ticket.tags == expected.tags
+    assert ticket.description == expected.description
+
+
+def test_list_ids_sees_external_creates(storage_with_tickets):
+    """Test that the cached ID listing notices files added outside storage."""
+    storage, tickets = storage_with_tickets
+    _age(storage.tickets_dir)
+    assert len(storage.list_ids()) == len(tickets)
+
+    other = TicketStorage(storage.config)
+    other.create(Ticket(id="bg-fff666", title="From elsewhere"))
+
+    assert "bg-fff666" in storage.list_ids()
+
+
 # ============================================================================
 # Delete Tests
 # ============================================================================
@@ -354,6 +414,43 @@ def test_list_all(storage_with_tickets):
     assert "New feature" in titles
 
 
+def test_list_all_parallel_matches_serial(storage_with_tickets, monkeypatch):
+    """Test that the thread-pool path returns the same tickets in order."""
+    import bodega.storage as storage_module
+
+    storage, _ = storage_with_tickets
+    serial = storage.list_all()
+
+    monkeypatch.setattr(storage_module, "_PARALLEL_READ_THRESHOLD", 0)
+    storage._ticket_cache.clear()
+    parallel = storage.list_all()
+
+    assert [t.to_markdown() for t in parallel] == [t.to_markdown() for t in serial]
+
+
+def test_version_stable_without_writes(storage_with_tickets):
+    """Test that the version token is unchanged when nothing is written."""
+    storage, _ = storage_with_tickets
+
+    assert storage.version() == storage.version()
+    storage.list_all()
+    assert storage.version() == storage.version()
+
+
+def test_version_changes_on_writes(storage_with_tickets):
+    """Test that save and delete change the version token."""
+    storage, tickets = storage_with_tickets
+
+    before = storage.version()
+    tickets[0].title = "Renamed"
+    storage.save(tickets[0])
+    after_save = storage.version()
+    assert after_save != before
+
+    storage.delete(tickets[1].id)
+    assert storage.version() != after_save
+
+
 # ============================================================================
 # Query Tests
 # ============================================================================
@@ -455,6 +552,25 @@ def test_query_multiple_filters(storage_with_tickets):
     assert all("urgent" in t.tags for t in results)
 
 
+def test_query_skips_parsing_rejected_tickets(storage_with_tickets, monkeypatch):
+    """Test that tickets rejected by their frontmatter are never fully parsed."""
+    storage, _ = storage_with_tickets
+    parsed = []
+    original = Ticket.from_dict.__func__
+
+    def counting_from_dict(cls, data):
+        parsed.append(data["id"])
+        return original(cls, data)
+
+    monkeypatch.setattr(Ticket, "from_dict", classmethod(counting_from_dict))
+    storage._ticket_cache.clear()
+
+    results = list(storage.query(assignee="bob"))
+
+    assert [t.id for t in results] == ["bg-ddd444"]
+    assert parsed == ["bg-ddd444"]
+
+
 # ============================================================================
 # File Locking Tests
 # ============================================================================
@@ -471,6 +587,78 @@ def test_file_lock_basic(storage, sample_ticket):
     assert loaded.title == "Updated title"
 
 
+def test_file_lock_uses_one_persistent_lock_file(storage, sample_ticket):
+    """Test that writes share a single lock file that is left in place."""
+    created = storage.create(sample_ticket)
+    storage.save(created)
+
+    assert storage._lock.lock_file
+    assert os.path.exists(storage._lock.lock_file)
+    assert not list(storage.tickets_dir.glob("*-*.lock"))
+
+
+def test_lock_file_stays_out_of_git_status(temp_git_repo, sample_ticket):
+    """Test that the lock file of a direct-mode repo isn't an untracked file."""
+    bodega_dir = init_repository(temp_git_repo)
+    subprocess.run(["git", "add", ".bodega/"], check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "Init bodega"], check=True, capture_output=True)
+
+    storage = TicketStorage(BodegaConfig(bodega_dir=bodega_dir))
+    created = storage.create(sample_ticket)
+    storage.save(created)
+    subprocess.run(["git", "add", ".bodega/"], check=True, capture_output=True)
+
+    status = subprocess.run(
+        ["git", "status", "--porcelain"], check=True, capture_output=True, text=True
+    )
+    assert "??" not in status.stdout
+    assert (temp_git_repo / ".git" / "bodega.lock").exists()
+
+
+def test_save_replaces_file_atomically(storage, sample_ticket):
+    """Test that saves go through a temporary file that is renamed into place."""
+    created = storage.create(sample_ticket)
+    path = storage._ticket_path(created.id)
+    before = path.stat().st_ino
+
+    created.title = "Updated title"
+    storage.save(created)
+
+    assert path.stat().st_ino != before
+    assert not list(storage.tickets_dir.glob(".*.tmp"))
+    assert storage.get(created.id).title == "Updated title"
+
+
+def test_save_keeps_file_mode(storage, sample_ticket):
+    """Test that an atomic save keeps the ticket file's permissions."""
+    created = storage.create(sample_ticket)
+    path = storage._ticket_path(created.id)
+    path.chmod(0o640)
+
+    created.title = "Updated title"
+    storage.save(created)
+
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_save_removes_temp_file_on_failure(storage, sample_ticket, monkeypatch):
+    """Test that a failed write leaves neither a temp file nor a changed ticket."""
+    created = storage.create(sample_ticket)
+    path = storage._ticket_path(created.id)
+    original = path.read_text()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    created.title = "Updated title"
+    with pytest.raises(OSError, match="disk full"):
+        storage.save(created)
+
+    assert not list(storage.tickets_dir.glob(".*.tmp"))
+    assert path.read_text() == original
+
+
 def test_file_lock_concurrent_writes(storage, sample_ticket):
     """Test file locking with simulated concurrent writes."""
     created = storage.create(sample_ticket)
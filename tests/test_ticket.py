@@ -107,6 +107,15 @@ def test_ticket_validation_id():
         Ticket(id="abc123", title="Test")  # no prefix
 
 
+def test_ticket_uses_slots():
+    """Test that tickets are slotted and reject unknown attributes."""
+    ticket = Ticket(id="bg-abc123", title="Test")
+
+    assert not hasattr(ticket, "__dict__")
+    with pytest.raises(AttributeError):
+        ticket.not_a_field = "x"
+
+
 def test_ticket_to_frontmatter():
     """Test converting ticket to frontmatter dict."""
     t = Ticket(
@@ -162,6 +171,23 @@ def test_ticket_to_markdown():
     assert "Some design" in md
 
 
+def test_ticket_to_markdown_matches_yaml_dumper():
+    """Test that frontmatter output matches PyYAML for plain and quoted values."""
+    titles = ["Fix login", "yes", "Title: with colon", "#hash", "x" * 100, "Caf\u00e9"]
+    for title in titles:
+        t = Ticket(
+            id="bg-abc123",
+            title=title,
+            tags=["api", "2024"],
+            deps=["bg-def456"],
+            assignee="Jane Doe",
+            description="Body",
+        )
+        post = frontmatter.Post("## Description\n\nBody", **t.to_frontmatter())
+
+        assert t.to_markdown() == frontmatter.dumps(post)
+
+
 def test_ticket_to_markdown_with_notes():
     """Test markdown generation with notes."""
     t = Ticket(
@@ -263,6 +289,9 @@ def test_ticket_add_note():
     assert len(t.notes) == 2
     assert "Second note" in t.notes[1]
 
+    # Note timestamp matches the updated time
+    assert t.notes[1].startswith(t.updated.strftime("%Y-%m-%d %H:%M"))
+
 
 def test_ticket_enum_serialization():
     """Test that enums serialize to strings, not enum objects."""
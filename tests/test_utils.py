@@ -16,6 +16,7 @@ from bodega.utils import (
     get_git_remote_url,
     get_project_identifier,
     find_offline_store,
+    parse_frontmatter,
 )
 from bodega.errors import TicketNotFoundError, AmbiguousIDError
 
@@ -79,6 +80,7 @@ def test_is_valid_id():
     assert not is_valid_id("1bg-abc123")  # prefix starts with number
     assert not is_valid_id("2-abc123")  # prefix is only a number
     assert not is_valid_id("-abc123")  # no prefix
+    assert not is_valid_id("bg-abc123\n")  # trailing newline
 
 
 # ============================================================================
@@ -117,6 +119,20 @@ def test_resolve_id_ambiguous():
         resolve_id("bg-a", ids)
 
 
+def test_resolve_id_sorted_matches_scan():
+    """Test that the binary-search path agrees with the linear scan."""
+    ids = sorted(["bg-abc", "bg-abc123", "bg-abd456", "bg-b12345", "bg-c00000"])
+
+    for partial in ["bg-abc", "bg-abc1", "bg-abd", "bg-b", "bg-c00000", "bg-", "bg-z", "a"]:
+        try:
+            expected = resolve_id(partial, ids)
+        except (TicketNotFoundError, AmbiguousIDError) as e:
+            with pytest.raises(type(e), match=str(e)):
+                resolve_id(partial, ids, is_sorted=True)
+        else:
+            assert resolve_id(partial, ids, is_sorted=True) == expected
+
+
 def test_resolve_id_not_found():
     """Test that non-matching IDs raise TicketNotFoundError."""
     ids = ["bg-abc123", "bg-def456"]
@@ -134,6 +150,27 @@ def test_resolve_id_empty_list():
         resolve_id("bg-abc123", [])
 
 
+# ============================================================================
+# Frontmatter Parsing Tests
+# ============================================================================
+
+
+def test_parse_frontmatter_matches_frontmatter_library():
+    """Test parse_frontmatter agrees with python-frontmatter on both paths."""
+    import frontmatter
+
+    texts = [
+        "---\nid: bg-abc123\ntitle: Test\ntags:\n- a\n---\nBody text\n",
+        "---\r\nid: bg-abc123\r\ntitle: CRLF\r\n---\r\nBody\r\n",
+        "\n---\ntitle: Leading blank\n---\n",
+        "---\nid: bg-abc123\ntitle: Mixed\n---\nLine one\r\nLine two\r\n",
+        "No frontmatter at all",
+    ]
+    for text in texts:
+        post = frontmatter.loads(text)
+        assert parse_frontmatter(text) == (post.metadata, post.content)
+
+
 # ============================================================================
 # Date/Time Utilities Tests
 # ============================================================================
@@ -257,6 +294,25 @@ def test_get_git_user():
         assert len(user) > 0
 
 
+def test_get_git_user_cached_per_directory(tmp_path, monkeypatch):
+    """Test that a found git user is cached, but a missing one is not."""
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise subprocess.CalledProcessError(1, args)
+        return subprocess.CompletedProcess(args, 0, stdout="Test User\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert get_git_user() is None
+    assert get_git_user() == "Test User"
+    assert get_git_user() == "Test User"
+    assert len(calls) == 2
+
+
 def test_find_repo_root():
     """Test finding git repository root."""
     root = find_repo_root()
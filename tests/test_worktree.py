@@ -4,19 +4,25 @@ import pytest
 import subprocess
 import shutil
 
+import bodega.worktree as worktree_module
 from bodega.worktree import (
     init_worktree,
     ensure_worktree,
     auto_commit_ticket,
+    auto_commit_tickets,
     has_uncommitted_changes,
     get_commits_ahead,
+    get_ahead_behind,
     get_sync_status,
+    get_current_branch,
     sync_branches,
     cleanup_worktree,
     _generate_batch_commit_message,
     _detect_ticket_state_change,
 )
-from bodega.storage import init_repository
+from bodega.storage import TicketStorage, init_repository
+from bodega.config import BodegaConfig
+from bodega.models import Ticket
 from bodega.errors import StorageError
 
 
@@ -267,6 +273,86 @@ def test_auto_commit_nothing_to_commit(temp_git_repo):
     assert commit_sha is None
 
 
+def test_auto_commit_tickets_single_commit(temp_git_repo):
+    """Test that several ticket changes are committed together."""
+    bodega_dir = temp_git_repo / ".bodega"
+    init_repository(temp_git_repo)
+    worktree_bodega_dir = init_worktree(temp_git_repo, bodega_dir, "bodega")
+    worktree_path = worktree_bodega_dir.parent
+
+    first = worktree_bodega_dir / "bg-aaa111.md"
+    second = worktree_bodega_dir / "bg-bbb222.md"
+    first.write_text("---\nid: bg-aaa111\ntitle: First\n---")
+    second.write_text("---\nid: bg-bbb222\ntitle: Second\n---")
+    auto_commit_ticket(worktree_path, first, "create", "bg-aaa111")
+
+    first.unlink()
+    gone = worktree_bodega_dir / "bg-ccc333.md"  # never committed
+
+    commit_sha = auto_commit_tickets(worktree_path, [first, second, gone], "Batch")
+    assert commit_sha is not None
+
+    result = subprocess.run(
+        ["git", "show", "--name-status", "--pretty=%s", "HEAD"],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True
+    )
+    assert result.stdout.startswith("Batch")
+    assert "D\t.bodega/bg-aaa111.md" in result.stdout
+    assert "A\t.bodega/bg-bbb222.md" in result.stdout
+
+
+def test_storage_transaction_commits_once(temp_git_repo):
+    """Test that writes inside a storage transaction make one commit."""
+    bodega_dir = init_repository(temp_git_repo)
+    init_worktree(temp_git_repo, bodega_dir, "bodega")
+    config = BodegaConfig(bodega_dir=bodega_dir, git_branch="bodega", git_auto_commit=True)
+    storage = TicketStorage(config)
+
+    def commit_count():
+        result = subprocess.run(
+            ["git", "rev-list", "--count", "bodega"],
+            capture_output=True,
+            text=True
+        )
+        return int(result.stdout)
+
+    before = commit_count()
+    with storage.transaction("Add two"):
+        storage.create(Ticket(id="bg-aaa111", title="First"))
+        storage.create(Ticket(id="bg-bbb222", title="Second"))
+    assert commit_count() == before + 1
+
+    storage.create(Ticket(id="bg-ccc333", title="Third"))
+    assert commit_count() == before + 2
+
+
+def test_storage_transaction_keeps_block_exception(temp_git_repo, monkeypatch):
+    """Test that a failing commit doesn't mask the error raised in the block."""
+    bodega_dir = init_repository(temp_git_repo)
+    init_worktree(temp_git_repo, bodega_dir, "bodega")
+    config = BodegaConfig(bodega_dir=bodega_dir, git_branch="bodega", git_auto_commit=True)
+    storage = TicketStorage(config)
+
+    def failing_commit(*args, **kwargs):
+        raise StorageError("commit failed")
+
+    monkeypatch.setattr("bodega.storage.auto_commit_tickets", failing_commit)
+
+    with pytest.raises(ValueError, match="block failed"):
+        with storage.transaction():
+            storage.create(Ticket(id="bg-aaa111", title="First"))
+            storage.create(Ticket(id="bg-bbb222", title="Second"))
+            raise ValueError("block failed")
+
+    # Outside the exception path a commit failure is still reported
+    with pytest.raises(StorageError, match="commit failed"):
+        with storage.transaction():
+            storage.create(Ticket(id="bg-ccc333", title="Third"))
+            storage.create(Ticket(id="bg-ddd444", title="Fourth"))
+
+
 # ============================================================================
 # Batch Commit Message Tests
 # ============================================================================
@@ -481,10 +567,93 @@ status: open
     assert "bg-test789: New ticket (created)" in commit_msg
 
 
+def test_generate_batch_commit_message_deleted_ticket(temp_git_repo):
+    """Test _generate_batch_commit_message lists deleted tickets by filename."""
+    bodega_dir = temp_git_repo / ".bodega"
+    init_repository(temp_git_repo)
+    worktree_bodega_dir = init_worktree(temp_git_repo, bodega_dir, "bodega")
+    worktree_path = worktree_bodega_dir.parent
+
+    ticket = worktree_bodega_dir / "bg-gone12.md"
+    ticket.write_text("---\nid: bg-gone12\ntitle: Going away\nstatus: open\n---\n")
+    subprocess.run(["git", "add", ".bodega/"], cwd=worktree_path, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "Initial"], cwd=worktree_path, check=True, capture_output=True)
+
+    ticket.unlink()
+    (worktree_bodega_dir / "bg-new123.md").write_text(
+        "---\nid: bg-new123\ntitle: Fresh\nstatus: open\n---\n"
+    )
+    subprocess.run(["git", "add", ".bodega/"], cwd=worktree_path, check=True, capture_output=True)
+
+    commit_msg = _generate_batch_commit_message(worktree_path, "Auto-commit")
+
+    assert "bg-gone12: (deleted)" in commit_msg
+    assert "bg-new123: Fresh (created)" in commit_msg
+
+
+def test_generate_batch_commit_message_path_with_space(temp_git_repo):
+    """Test a deleted ticket whose filename contains a space."""
+    bodega_dir = temp_git_repo / ".bodega"
+    init_repository(temp_git_repo)
+    worktree_bodega_dir = init_worktree(temp_git_repo, bodega_dir, "bodega")
+    worktree_path = worktree_bodega_dir.parent
+
+    ticket = worktree_bodega_dir / "bg-sp ace.md"
+    ticket.write_text("---\nid: bg-space\ntitle: Spaced\nstatus: open\n---\n")
+    subprocess.run(["git", "add", ".bodega/"], cwd=worktree_path, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "Initial"], cwd=worktree_path, check=True, capture_output=True)
+
+    ticket.unlink()
+    subprocess.run(["git", "add", ".bodega/"], cwd=worktree_path, check=True, capture_output=True)
+
+    commit_msg = _generate_batch_commit_message(worktree_path, "Auto-commit")
+
+    assert "bg-sp ace: (deleted)" in commit_msg
+
+
+def test_generate_batch_commit_message_without_cat_file(temp_git_repo, monkeypatch):
+    """Test that a failed cat-file batch falls back to per-file reads."""
+    bodega_dir = temp_git_repo / ".bodega"
+    init_repository(temp_git_repo)
+    worktree_bodega_dir = init_worktree(temp_git_repo, bodega_dir, "bodega")
+    worktree_path = worktree_bodega_dir.parent
+
+    ticket = worktree_bodega_dir / "bg-fall12.md"
+    ticket.write_text("---\nid: bg-fall12\ntitle: Fallback\nstatus: open\n---\n")
+    subprocess.run(["git", "add", ".bodega/"], cwd=worktree_path, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "Initial"], cwd=worktree_path, check=True, capture_output=True)
+
+    ticket.write_text("---\nid: bg-fall12\ntitle: Fallback\nstatus: closed\n---\n")
+    subprocess.run(["git", "add", ".bodega/"], cwd=worktree_path, check=True, capture_output=True)
+
+    monkeypatch.setattr(worktree_module, "_cat_file_batch", lambda cwd, objects: None)
+    commit_msg = _generate_batch_commit_message(worktree_path, "Auto-commit")
+
+    assert "bg-fall12: Fallback (closed)" in commit_msg
+
+
 # ============================================================================
 # Status Check Tests
 # ============================================================================
 
+def test_get_current_branch_follows_checkout(temp_git_repo):
+    """Test get_current_branch tracks checkouts in repo and worktree."""
+    bodega_dir = temp_git_repo / ".bodega"
+    init_repository(temp_git_repo)
+    init_worktree(temp_git_repo, bodega_dir, "bodega")
+
+    main_branch = get_current_branch(temp_git_repo)
+    assert get_current_branch(temp_git_repo) == main_branch
+    assert get_current_branch(bodega_dir / "worktree") == "bodega"
+
+    subprocess.run(["git", "checkout", "-b", "feature"], check=True, capture_output=True)
+    assert get_current_branch(temp_git_repo) == "feature"
+
+    subprocess.run(["git", "checkout", "--detach"], check=True, capture_output=True)
+    with pytest.raises(StorageError, match="detached HEAD"):
+        get_current_branch(temp_git_repo)
+
+
 def test_has_uncommitted_changes_empty(temp_git_repo):
     """Test has_uncommitted_changes returns False for clean repo."""
     bodega_dir = temp_git_repo / ".bodega"
@@ -563,6 +732,13 @@ def test_get_commits_ahead(temp_git_repo):
     commits_ahead = get_commits_ahead(temp_git_repo, "bodega", "main")
     assert commits_ahead == initial_ahead + 1
 
+    # Both directions in one call match the separate counts
+    assert get_ahead_behind(temp_git_repo, "bodega", "main") == (
+        commits_ahead,
+        get_commits_ahead(temp_git_repo, "main", "bodega"),
+    )
+    assert get_ahead_behind(temp_git_repo, "bodega", "no-such-branch") == (0, 0)
+
 
 def test_get_sync_status(temp_git_repo):
     """Test get_sync_status returns correct status."""